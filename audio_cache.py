@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Audio Cache - synthesized speech on disk
+Shared text-to-speech clip cache for the language apps.
+
+Clips are content-addressed: the file name is a hash of (text, lang, slow),
+so each clip is synthesized once and then read from disk. The cache is
+capped in size and evicts the least recently played clips first; file
+modification times record use, so the order survives restarts. Clips are
+written to a temporary file and renamed into place, so a crash or a second
+process never sees half a clip. Each TTS backend gets its own directory,
+so switching engines never plays another engine's clips.
+
+AudioPrefetcher synthesizes clips on a background thread before they are
+needed, so a quiz that knows its upcoming questions never waits on TTS.
+
+    python3 audio_cache.py                  # show what is cached
+    python3 audio_cache.py --backend espeak --clear
+"""
+
+import argparse
+import hashlib
+import os
+import queue
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+CACHE_HOME = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+DEFAULT_DIR = Path(os.environ.get("LANGUAGE_AUDIO_CACHE",
+                                  CACHE_HOME / "language-learning" / "tts"))
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+SUFFIX = ".clip"
+STALE_TMP_SECONDS = 60 * 60
+
+
+def cache_key(text, lang, slow):
+    """Content address of one clip"""
+    return hashlib.sha256(f"{lang}\0{int(bool(slow))}\0{text}".encode("utf-8")).hexdigest()
+
+
+def backend_dir(name):
+    """Default cache directory for clips made by one TTS backend"""
+    return DEFAULT_DIR / name
+
+
+class AudioCache:
+    """Size-capped LRU cache of synthesized clips"""
+
+    def __init__(self, synthesize, directory=DEFAULT_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        # synthesize(text, lang, slow) returns a clip's bytes (see tts_backends)
+        self.synthesize = synthesize
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        # key -> size in bytes, least recently used first
+        self._entries = OrderedDict()
+        self._bytes = 0
+        # Guards the index; key -> Event for clips being synthesized, so a
+        # clip requested by two threads at once is only synthesized once
+        self._lock = threading.RLock()
+        self._pending = {}
+        found = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".tmp"):
+                # Left behind by a write that never finished (a recent one
+                # may still be in progress in another process)
+                if time.time() - entry.stat().st_mtime > STALE_TMP_SECONDS:
+                    self._unlink(Path(entry.path))
+            elif entry.name.endswith(SUFFIX):
+                stat = entry.stat()
+                found.append((stat.st_mtime, entry.name[:-len(SUFFIX)], stat.st_size))
+        for _, key, size in sorted(found):
+            self._entries[key] = size
+            self._bytes += size
+        self._evict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, item):
+        text, lang, slow = item
+        return cache_key(text, lang, slow) in self._entries
+
+    @property
+    def size(self):
+        """Total bytes of cached clips"""
+        return self._bytes
+
+    def path_for(self, key):
+        return self.directory / (key + SUFFIX)
+
+    @staticmethod
+    def _unlink(path):
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def _lookup(self, key):
+        # Caller holds the lock
+        if key not in self._entries:
+            # Another process sharing the directory may have written it
+            try:
+                size = self.path_for(key).stat().st_size
+            except FileNotFoundError:
+                return False
+            self._entries[key] = size
+            self._bytes += size
+            self._evict()
+            return True
+        try:
+            # Touch the file so the LRU order is kept on disk too
+            os.utime(self.path_for(key))
+        except FileNotFoundError:
+            # Evicted by another process sharing the directory
+            self._bytes -= self._entries.pop(key)
+            return False
+        self._entries.move_to_end(key)
+        return True
+
+    def _fetch(self, text, lang, slow, count):
+        """Make sure the clip is cached; returns (path, True if it was synthesized)"""
+        key = cache_key(text, lang, slow)
+        path = self.path_for(key)
+        while True:
+            with self._lock:
+                if self._lookup(key):
+                    if count:
+                        self.hits += 1
+                    return path, False
+                pending = self._pending.get(key)
+                if pending is None:
+                    if count:
+                        self.misses += 1
+                    pending = self._pending[key] = threading.Event()
+                    break
+            # Another thread is synthesizing this clip: wait, then look again
+            pending.wait()
+
+        try:
+            self.put(key, self.synthesize(text, lang, slow))
+        finally:
+            with self._lock:
+                del self._pending[key]
+            pending.set()
+        return path, True
+
+    def get(self, text, lang="th", slow=False):
+        """Return the path of the clip, synthesizing it on a miss"""
+        return self._fetch(text, lang, slow, count=True)[0]
+
+    def warm(self, text, lang="th", slow=False):
+        """Cache the clip ahead of use (not counted as a hit or a miss);
+        returns True if it had to be synthesized"""
+        return self._fetch(text, lang, slow, count=False)[1]
+
+    def read(self, text, lang="th", slow=False):
+        """Return the bytes of the clip, synthesizing it on a miss"""
+        return self.get(text, lang, slow).read_bytes()
+
+    def put(self, key, data):
+        """Store a clip atomically under key"""
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, self.path_for(key))
+        except BaseException:
+            self._unlink(Path(tmp))
+            raise
+        with self._lock:
+            self._bytes += len(data) - self._entries.pop(key, 0)
+            self._entries[key] = len(data)
+            self._evict()
+
+    def _evict(self):
+        # The newest clip is kept even if it alone is over the cap
+        while self._bytes > self.max_bytes and len(self._entries) > 1:
+            key, size = self._entries.popitem(last=False)
+            self._bytes -= size
+            self._unlink(self.path_for(key))
+
+    def clear(self):
+        """Delete every cached clip"""
+        with self._lock:
+            for key in self._entries:
+                self._unlink(self.path_for(key))
+            self._entries.clear()
+            self._bytes = 0
+
+
+# Marker telling the prefetch thread to stop
+_STOP = object()
+
+
+class AudioPrefetcher:
+    """Background thread warming an AudioCache for upcoming clips.
+
+    submit() never blocks: when the bounded queue is full the request is
+    dropped and the clip is synthesized on demand instead. cancel() drops
+    everything queued, e.g. when a session ends early.
+    """
+
+    def __init__(self, cache, maxsize=16):
+        self.cache = cache
+        self.prefetched = 0
+        self.already_cached = 0
+        self.dropped = 0
+        self.cancelled = 0
+        self.errors = 0
+        self._queue = queue.Queue(maxsize)
+        self._generation = 0
+        self._thread = None
+
+    def submit(self, text, lang="th", slow=False):
+        """Queue a clip for synthesis; returns False if the queue is full"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="audio-prefetch", daemon=True)
+            self._thread.start()
+        try:
+            self._queue.put_nowait((self._generation, str(text).strip(), lang, slow))
+            return True
+        except queue.Full:
+            self.dropped += 1
+            return False
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+            generation, text, lang, slow = item
+            if generation != self._generation:
+                self.cancelled += 1
+                continue
+            try:
+                if self.cache.warm(text, lang, slow):
+                    self.prefetched += 1
+                else:
+                    self.already_cached += 1
+            except Exception:
+                # The clip is synthesized again, and the error shown, on playback
+                self.errors += 1
+
+    def cancel(self):
+        """Drop every queued request (a clip already being synthesized finishes)"""
+        self._generation += 1
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not _STOP:
+                self.cancelled += 1
+
+    def close(self):
+        """Cancel queued requests and stop the thread"""
+        self.cancel()
+        if self._thread is not None:
+            self._queue.put(_STOP)
+            self._thread.join()
+            self._thread = None
+
+    def stats(self):
+        """Counters for this prefetcher and the playback hits/misses of its cache"""
+        return {
+            "hits": self.cache.hits, "misses": self.cache.misses,
+            "prefetched": self.prefetched, "already_cached": self.already_cached,
+            "dropped": self.dropped, "cancelled": self.cancelled, "errors": self.errors,
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect or clear the TTS clip cache")
+    parser.add_argument("--backend", default=os.environ.get("LANGUAGE_TTS", "gtts"),
+                        help="TTS backend whose clips to show (default: %(default)s)")
+    parser.add_argument("--dir", help="cache directory (default: one per backend under "
+                                      f"{DEFAULT_DIR})")
+    parser.add_argument("--clear", action="store_true", help="delete every cached clip")
+    args = parser.parse_args()
+
+    cache = AudioCache(None, args.dir or backend_dir(args.backend))
+    if args.clear:
+        cache.clear()
+        print(f"Cleared {cache.directory}")
+    else:
+        print(f"{cache.directory}: {len(cache)} clips, {cache.size / 1024:.0f} KiB "
+              f"(limit {cache.max_bytes / 1024 / 1024:.0f} MiB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Audio Daemon - shared local playback service
+A long-lived process that holds an initialized pygame mixer, the decoded-clip
+cache and the on-disk clip cache, and plays clips for any app that asks over
+a Unix domain socket. Apps that find it running skip pygame and the mixer
+entirely, so their startup carries no audio cost, and clips decoded for one
+session stay warm for the next.
+
+    python3 audio_daemon.py --pack language-learning/thai_audio.pack &
+
+Protocol: one JSON object per line in each direction.
+    {"cmd": "play", "text": ..., "lang": ..., "slow": false, "queue": false}
+    {"cmd": "stop"} / {"cmd": "ping"} / {"cmd": "stats"} / {"cmd": "shutdown"}
+Every request gets {"ok": true, ...} or {"ok": false, "error": ...}.
+"""
+
+import argparse
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+from audio_cache import AudioCache, backend_dir
+from audio_pack import open_pack
+from audio_player import ClipPlayer
+from tts_backends import BACKENDS, DEFAULT_BACKEND, get_backend
+
+RUNTIME_DIR = Path(os.environ.get("XDG_RUNTIME_DIR", tempfile.gettempdir()))
+DEFAULT_SOCKET = Path(os.environ.get(
+    "LANGUAGE_AUDIO_SOCKET",
+    RUNTIME_DIR / f"language-learning-audio-{os.getuid() if hasattr(os, 'getuid') else 0}.sock"))
+
+CONNECT_TIMEOUT = 0.2
+REQUEST_TIMEOUT = 2.0
+
+
+class AudioService:
+    """Player state shared by every client of the daemon"""
+
+    def __init__(self, backend, packs=()):
+        self.backend = backend
+        self.cache = AudioCache(backend, backend_dir(backend.name))
+        self.packs = [pack for pack in (open_pack(path) for path in packs) if pack is not None]
+        self.player = ClipPlayer(self.load_clip)
+
+    def load_clip(self, text, lang, slow):
+        for pack in self.packs:
+            data = pack.get(text, lang, slow)
+            if data is not None:
+                return data
+        return self.cache.read(text, lang, slow)
+
+    def handle(self, request):
+        """Serve one request; returns the reply"""
+        cmd = request.get("cmd")
+        if cmd == "play":
+            error = self.player.take_error()
+            self.player.play(request["text"], request.get("lang", "th"),
+                             bool(request.get("slow", False)), bool(request.get("queue", False)))
+            if error is not None:
+                return {"ok": True, "error": str(error)}
+        elif cmd == "stop":
+            self.player.stop()
+        elif cmd == "stats":
+            return {"ok": True, "decoded_hits": self.player.hits,
+                    "decoded_misses": self.player.misses, "cache_hits": self.cache.hits,
+                    "cache_misses": self.cache.misses, "tts": self.backend.stats()}
+        elif cmd != "ping" and cmd != "shutdown":
+            return {"ok": False, "error": f"unknown command {cmd!r}"}
+        return {"ok": True}
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+                reply = self.server.service.handle(request)
+            except (ValueError, KeyError, AttributeError) as e:
+                request, reply = {}, {"ok": False, "error": f"bad request: {e}"}
+            self.wfile.write(json.dumps(reply).encode("utf-8") + b"\n")
+            self.wfile.flush()
+            if request.get("cmd") == "shutdown":
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+                return
+
+
+class AudioServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path, service):
+        self.service = service
+        super().__init__(str(path), _Handler)
+
+
+def is_running(path=DEFAULT_SOCKET):
+    """True if a daemon is listening on path"""
+    client = AudioClient.connect(path)
+    if client is None:
+        return False
+    client.close()
+    return True
+
+
+def serve(path=DEFAULT_SOCKET, backend=None, packs=()):
+    """Run the daemon in the foreground until shut down"""
+    path = Path(path)
+    if path.exists():
+        if is_running(path):
+            raise RuntimeError(f"An audio daemon is already listening on {path}")
+        # Left behind by a daemon that did not exit cleanly
+        path.unlink()
+
+    service = AudioService(backend or get_backend(), packs)
+    # Initialize the mixer now, so the first play request is as fast as the rest
+    service.player._mixer()
+    server = AudioServer(path, service)
+    # Exit through the cleanup below on kill as well as on Ctrl-C
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        service.player.close()
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class AudioClient:
+    """Talks to a running daemon with the same play/stop interface as
+    ClipPlayer. If the daemon goes away mid-session, playback moves to the
+    player made by fallback(), if given."""
+
+    def __init__(self, sock, fallback=None):
+        self._sock = sock
+        self._file = sock.makefile("rwb")
+        self._fallback = fallback
+        self._local = None
+        self._error = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def connect(cls, path=DEFAULT_SOCKET, fallback=None):
+        """Return a client for the daemon at path, or None if none is running"""
+        if not hasattr(socket, "AF_UNIX"):
+            return None
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(CONNECT_TIMEOUT)
+        try:
+            sock.connect(str(path))
+        except OSError:
+            sock.close()
+            return None
+        sock.settimeout(REQUEST_TIMEOUT)
+        return cls(sock, fallback)
+
+    def request(self, cmd, **fields):
+        """Send one request and return the reply"""
+        with self._lock:
+            self._file.write(json.dumps(dict(fields, cmd=cmd)).encode("utf-8") + b"\n")
+            self._file.flush()
+            line = self._file.readline()
+        if not line:
+            raise ConnectionError("audio daemon closed the connection")
+        return json.loads(line)
+
+    def _call(self, cmd, **fields):
+        if self._local is None:
+            try:
+                reply = self.request(cmd, **fields)
+                if reply.get("error"):
+                    self._error = RuntimeError(reply["error"])
+                return
+            except (OSError, ValueError) as e:
+                self._error = e
+                if self._fallback is None:
+                    return
+                self._disconnect()
+                self._local = self._fallback()
+        getattr(self._local, cmd)(*fields.values())
+
+    def play(self, text, lang="th", slow=False, queue=False):
+        """Start a clip on the daemon and return at once"""
+        self._call("play", text=text, lang=lang, slow=slow, queue=queue)
+
+    def stop(self):
+        """Drop queued clips and cut off the one playing"""
+        self._call("stop")
+
+    def take_error(self):
+        """Return (and forget) the last playback error, if any"""
+        error, self._error = self._error, None
+        if error is None and self._local is not None:
+            error = self._local.take_error()
+        return error
+
+    def _disconnect(self):
+        try:
+            self._file.close()
+        except OSError:
+            pass
+        self._sock.close()
+
+    def close(self):
+        """Disconnect (the daemon keeps running)"""
+        self._disconnect()
+        if self._local is not None:
+            self._local.close()
+
+
+def audio_player(load_clip, path=DEFAULT_SOCKET):
+    """The daemon's player when one is running, else an in-process ClipPlayer"""
+    client = AudioClient.connect(path, fallback=lambda: ClipPlayer(load_clip))
+    return client if client is not None else ClipPlayer(load_clip)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the shared audio playback daemon")
+    parser.add_argument("--socket", default=str(DEFAULT_SOCKET),
+                        help="Unix socket to listen on (default: %(default)s)")
+    parser.add_argument("--backend", default=DEFAULT_BACKEND, choices=list(BACKENDS),
+                        help="TTS backend for clips not in a pack (default: %(default)s)")
+    parser.add_argument("--pack", action="append", default=[],
+                        help="audio pack to play from (repeatable)")
+    parser.add_argument("--stop", action="store_true", help="shut down a running daemon")
+    args = parser.parse_args()
+
+    if args.stop:
+        client = AudioClient.connect(args.socket)
+        if client is None:
+            print(f"No audio daemon on {args.socket}")
+            return
+        client.request("shutdown")
+        client.close()
+        print("Audio daemon stopped")
+        return
+
+    print(f"Audio daemon listening on {args.socket} (Ctrl-C to stop)")
+    try:
+        serve(args.socket, get_backend(args.backend), args.pack)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+Audio Pack - pre-rendered speech archive
+A single file holding synthesized clips, built offline so a machine can run
+the quizzes without ever calling a TTS engine.
+
+Clips are addressed by the same (text, lang, slow) key as the AudioCache.
+The file is opened with mmap and the sorted index is binary-searched in
+place, so a clip is read at its offset without unpacking anything.
+
+File layout (little-endian):
+    header   magic, version, entry count
+    index    one (key digest, offset, length) record per clip, sorted by key
+    data     the clip bytes, back to back
+"""
+
+import mmap
+import os
+import struct
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from audio_cache import cache_key
+
+MAGIC = b"TTSP"
+VERSION = 1
+HEADER = struct.Struct("<4sHxxI")
+ENTRY = struct.Struct("<32sQI")
+
+
+def pack_key(text, lang, slow):
+    """Index key of one clip (the raw cache_key digest)"""
+    return bytes.fromhex(cache_key(text, lang, slow))
+
+
+class AudioPack:
+    """Read-only, memory-mapped view of an audio pack"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, count = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            self._mm.close()
+            raise ValueError(f"{self.path} is not a version {VERSION} audio pack")
+        self._count = count
+        self._data_start = HEADER.size + count * ENTRY.size
+
+    def __len__(self):
+        return self._count
+
+    def _entry(self, i):
+        return ENTRY.unpack_from(self._mm, HEADER.size + i * ENTRY.size)
+
+    def find(self, key):
+        """Return (offset, length) of the clip with this key, or None"""
+        low, high = 0, self._count
+        while low < high:
+            mid = (low + high) // 2
+            entry_key, offset, length = self._entry(mid)
+            if entry_key < key:
+                low = mid + 1
+            elif entry_key > key:
+                high = mid
+            else:
+                return self._data_start + offset, length
+        return None
+
+    def read_key(self, key):
+        """Bytes of the clip with this key, or None"""
+        found = self.find(key)
+        if found is None:
+            return None
+        offset, length = found
+        return self._mm[offset:offset + length]
+
+    def get(self, text, lang="th", slow=False):
+        """Bytes of a clip, or None if it is not in the pack"""
+        return self.read_key(pack_key(text, lang, slow))
+
+    def __contains__(self, item):
+        text, lang, slow = item
+        return self.find(pack_key(text, lang, slow)) is not None
+
+    def close(self):
+        self._mm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def open_pack(path):
+    """Open the pack at path, or return None if there is no usable pack"""
+    try:
+        return AudioPack(path)
+    except (OSError, ValueError):
+        return None
+
+
+def synthesize_all(clips, synthesize, workers=None):
+    """Synthesize (text, lang, slow) clips across a process pool"""
+    if workers == 1 or len(clips) <= 1:
+        return [synthesize(*clip) for clip in clips]
+    texts, langs, slows = zip(*clips)
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        return list(pool.map(synthesize, texts, langs, slows))
+
+
+def build_pack(clips, path, synthesize, workers=None, force=False):
+    """Write a pack holding every (text, lang, slow) clip (atomically replaced).
+
+    Clips already in the existing pack at path are copied over rather than
+    synthesized again, unless force is set. synthesize (e.g. a TTS backend)
+    must be picklable so it can run in worker processes. Returns (reused,
+    synthesized).
+    """
+    path = Path(path)
+    clips = list(dict.fromkeys(clips))
+    keys = [pack_key(*clip) for clip in clips]
+
+    data = {}
+    old = None if force else open_pack(path)
+    if old is not None:
+        with old:
+            for key in keys:
+                blob = old.read_key(key)
+                if blob is not None:
+                    data[key] = blob
+    reused = len(data)
+
+    missing = [(clip, key) for clip, key in zip(clips, keys) if key not in data]
+    if missing:
+        blobs = synthesize_all([clip for clip, _ in missing], synthesize, workers)
+        for (_, key), blob in zip(missing, blobs):
+            data[key] = blob
+
+    index = bytearray()
+    offset = 0
+    for key in sorted(data):
+        index.extend(ENTRY.pack(key, offset, len(data[key])))
+        offset += len(data[key])
+
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(data)))
+        f.write(index)
+        for key in sorted(data):
+            f.write(data[key])
+    os.replace(tmp_path, path)
+    return reused, len(missing)
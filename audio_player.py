@@ -0,0 +1,156 @@
+"""
+Audio Player - in-memory playback
+Plays synthesized clips straight from bytes with pygame.mixer.Sound: no
+temporary files, and no re-decoding of clips played recently. Decoded clips
+are kept in an LRU bounded by their decoded size, so replaying a letter
+starts at once from the buffer already in memory.
+
+Playback is asynchronous: play() hands the clip to a player thread and
+returns at once. A new clip cuts off the one playing (or waits its turn with
+queue=True), so the question loop never stalls on audio.
+
+pygame is imported on first playback.
+"""
+
+import io
+import os
+import threading
+from collections import OrderedDict, deque
+
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+
+class ClipPlayer:
+    """Decodes and plays clips on a background thread, keeping recently
+    played ones decoded"""
+
+    def __init__(self, load_clip, max_bytes=DEFAULT_MAX_BYTES):
+        # load_clip(text, lang, slow) returns the encoded clip (MP3, WAV, ...)
+        self.load_clip = load_clip
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self._sounds = OrderedDict()
+        self._bytes = 0
+        self._pygame = None
+        self._decode_lock = threading.RLock()
+
+        # Clips waiting to play, tagged with the generation they were queued
+        # in; stop() starts a new generation so stale clips are skipped
+        self._queue = deque()
+        self._generation = 0
+        self._busy = False
+        self._closed = False
+        self._error = None
+        self._cond = threading.Condition()
+        self._interrupt = threading.Event()
+        self._thread = None
+
+    def _mixer(self):
+        if self._pygame is None:
+            # SDL would otherwise take over SIGINT and SIGTERM, so Ctrl-C
+            # and kill stop working once the mixer is up
+            os.environ.setdefault("SDL_NO_SIGNAL_HANDLERS", "1")
+            import pygame
+            self._pygame = pygame
+        if not self._pygame.mixer.get_init():
+            self._pygame.mixer.init()
+        return self._pygame
+
+    def _decoded_size(self, sound):
+        frequency, size, channels = self._pygame.mixer.get_init()
+        return int(sound.get_length() * frequency * channels * abs(size) // 8)
+
+    def sound(self, text, lang="th", slow=False):
+        """Return the decoded clip, decoding it on a miss"""
+        key = (text, lang, slow)
+        with self._decode_lock:
+            pygame = self._mixer()
+            if key in self._sounds:
+                self._sounds.move_to_end(key)
+                self.hits += 1
+                return self._sounds[key][0]
+
+            self.misses += 1
+            sound = pygame.mixer.Sound(file=io.BytesIO(self.load_clip(text, lang, slow)))
+            size = self._decoded_size(sound)
+            self._sounds[key] = (sound, size)
+            self._bytes += size
+            # The newest clip is kept even if it alone is over the cap
+            while self._bytes > self.max_bytes and len(self._sounds) > 1:
+                _, (_, evicted) = self._sounds.popitem(last=False)
+                self._bytes -= evicted
+            return sound
+
+    def play(self, text, lang="th", slow=False, queue=False):
+        """Start a clip and return at once. It cuts off whatever is playing,
+        or with queue=True plays after the clips already queued."""
+        with self._cond:
+            if not queue:
+                self._cancel()
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="audio-player", daemon=True)
+                self._thread.start()
+            self._queue.append((self._generation, text, lang, slow))
+            self._cond.notify_all()
+
+    def _cancel(self):
+        # Caller holds the condition
+        self._generation += 1
+        self._queue.clear()
+        self._interrupt.set()
+
+    def stop(self):
+        """Drop queued clips and cut off the one playing"""
+        with self._cond:
+            self._cancel()
+
+    def wait(self, timeout=None):
+        """Block until every queued clip has played; False on timeout"""
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._queue and not self._busy, timeout)
+
+    def take_error(self):
+        """Return (and forget) the last playback error, if any"""
+        with self._cond:
+            error, self._error = self._error, None
+            return error
+
+    def _run(self):
+        while True:
+            with self._cond:
+                self._busy = False
+                self._cond.notify_all()
+                self._cond.wait_for(lambda: self._queue or self._closed)
+                if self._closed:
+                    return
+                generation, text, lang, slow = self._queue.popleft()
+                if generation != self._generation:
+                    continue
+                self._busy = True
+                self._interrupt.clear()
+
+            try:
+                sound = self.sound(text, lang, slow)
+                if self._interrupt.is_set():
+                    continue
+                channel = sound.play()
+                # Sleeps for the length of the clip unless something newer
+                # interrupts it
+                if self._interrupt.wait(sound.get_length()) and channel is not None:
+                    channel.stop()
+            except Exception as e:
+                with self._cond:
+                    self.errors += 1
+                    self._error = e
+
+    def close(self):
+        """Stop playback and the player thread"""
+        with self._cond:
+            self._cancel()
+            self._closed = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark - distractor drawing cost per question
+Shows that DistractorIndex.draw stays flat as the deck grows from 1k to 1M
+words, next to the old full-scan-and-shuffle approach.
+
+    python3 benchmarks/bench_distractors.py
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from japanese_distractors import DistractorIndex
+
+SIZES = [1_000, 10_000, 100_000, 1_000_000]
+LEGACY_LIMIT = 100_000
+
+
+class SyntheticDeck:
+    """Deck of n words with distinct translations, generated on access"""
+
+    def __init__(self, n):
+        self.n = n
+
+    def __len__(self):
+        return self.n
+
+    def __getitem__(self, index):
+        return {"kanji": f"k{index}", "english": self.field(index, "english")}
+
+    def field(self, index, name):
+        return f"{name}-{index}"
+
+
+def legacy_draw(deck, correct_word, language):
+    """The previous generate_choices strategy: scan, shuffle, take 3"""
+    wrong_answers = [
+        deck[i][language] for i in range(len(deck))
+        if deck[i]["kanji"] != correct_word["kanji"]
+    ]
+    random.shuffle(wrong_answers)
+    return wrong_answers[:3]
+
+
+def per_call_us(func, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main():
+    print(f"{'words':>10}  {'build (s)':>10}  {'draw (us)':>10}  {'legacy (us)':>12}")
+    for n in SIZES:
+        deck = SyntheticDeck(n)
+        start = time.perf_counter()
+        index = DistractorIndex(deck, "english")
+        build = time.perf_counter() - start
+
+        correct = deck[n // 2]
+        draw = per_call_us(lambda: index.draw([correct["english"]], 3), 100_000)
+
+        if n <= LEGACY_LIMIT:
+            legacy = f"{per_call_us(lambda: legacy_draw(deck, correct, 'english'), 3):12.0f}"
+        else:
+            legacy = f"{'-':>12}"
+        print(f"{n:>10}  {build:>10.2f}  {draw:>10.2f}  {legacy}")
+
+
+if __name__ == "__main__":
+    main()
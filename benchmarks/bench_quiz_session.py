@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Benchmark - headless QuizSession throughput
+Drives simulated learners through QuizSession with no terminal I/O and
+reports questions per minute for each target language and distractor mode.
+
+    python3 benchmarks/bench_quiz_session.py [--questions N]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from japanese_flashcards import DISTRACTOR_MODES, LANGUAGES, simulate
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark headless quiz sessions")
+    parser.add_argument("--questions", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'language':>10}  {'distractors':>11}  {'accuracy':>8}  {'questions/min':>14}")
+    for language, _ in LANGUAGES.values():
+        for distractors, _ in DISTRACTOR_MODES.values():
+            # Warm up so index builds are not counted as question time
+            simulate(language, 10, distractors=distractors, seed=args.seed)
+
+            start = time.perf_counter()
+            score, total = simulate(language, args.questions, distractors=distractors,
+                                    seed=args.seed)
+            elapsed = time.perf_counter() - start
+            print(f"{language:>10}  {distractors:>11}  {score / total:>8.1%}  "
+                  f"{total / elapsed * 60:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
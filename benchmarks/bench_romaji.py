@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Benchmark - romaji generation at compile time
+Times to_romaji over the deck's readings repeated up to 1M entries, which is
+the extra work compile_store does now that romaji is no longer stored.
+
+    python3 benchmarks/bench_romaji.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from japanese_romaji import to_romaji
+from japanese_vocab_store import load_parts
+
+SIZES = [1_000, 10_000, 100_000, 1_000_000]
+
+
+def main():
+    readings = [entry["kana"] for entry in load_parts()]
+    print(f"{'entries':>10}  {'total (s)':>10}  {'per entry (us)':>15}")
+    for n in SIZES:
+        batch = (readings * (n // len(readings) + 1))[:n]
+        start = time.perf_counter()
+        for kana in batch:
+            to_romaji(kana)
+        total = time.perf_counter() - start
+        print(f"{n:>10}  {total:>10.3f}  {total / n * 1e6:>15.2f}")
+
+
+if __name__ == "__main__":
+    main()
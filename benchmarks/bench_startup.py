@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Thai quiz startup cost
+Imports thai_alphabet in a fresh interpreter under `python -X importtime`
+and reports what startup costs with audio off, and what the first clip adds
+(audio modules, TTS backend, pygame and the mixer).
+
+    python3 benchmarks/bench_startup.py [--runs N] [--top N]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+APP_DIR = ROOT / "language-learning"
+
+SCENARIOS = {
+    "no audio": "import thai_alphabet",
+    "first clip": ("import thai_alphabet as t; t.init_audio(); "
+                   "from audio_player import ClipPlayer; ClipPlayer(t.load_clip)._mixer()"),
+}
+
+
+def import_times(code):
+    """Run code in a fresh interpreter; returns (wall ms, {module: cumulative ms})
+    for the top-level imports"""
+    # The stub backend and dummy audio driver keep the network and the sound
+    # card out of the measurement
+    env = dict(os.environ, LANGUAGE_TTS="stub", SDL_AUDIODRIVER="dummy",
+               PYGAME_HIDE_SUPPORT_PROMPT="1")
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=APP_DIR,
+                            env=env, capture_output=True, text=True, check=True)
+    wall_ms = (time.perf_counter() - start) * 1000
+
+    modules = {}
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not name.startswith("  "):
+            modules[name.strip()] = int(cumulative) / 1000
+    return wall_ms, modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Thai quiz startup")
+    parser.add_argument("--runs", type=int, default=5, help="runs per scenario (best is kept)")
+    parser.add_argument("--top", type=int, default=8, help="heaviest imports to list")
+    args = parser.parse_args()
+
+    results = {}
+    for name, code in SCENARIOS.items():
+        runs = [import_times(code) for _ in range(args.runs)]
+        results[name] = min(runs, key=lambda run: sum(run[1].values()))
+
+    for name, (wall_ms, modules) in results.items():
+        print(f"\n{name}: {sum(modules.values()):.1f} ms importing, "
+              f"{wall_ms:.1f} ms wall ({len(modules)} top-level imports)")
+        for module, ms in sorted(modules.items(), key=lambda m: -m[1])[:args.top]:
+            print(f"  {ms:>8.1f} ms  {module}")
+
+    quiet = sum(results["no audio"][1].values())
+    audio = sum(results["first clip"][1].values())
+    print(f"\nAudio setup adds {audio - quiet:.1f} ms, paid on the first clip "
+          f"(or never with --no-audio)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Benchmark - TTS backend latency
+Synthesizes the same Thai letters and words with every backend available on
+this machine and reports the latency of each, to pick the fastest engine for
+a deployment (set it with LANGUAGE_TTS).
+
+    python3 benchmarks/bench_tts_backends.py [--rounds N] [--backend NAME ...]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tts_backends import BACKENDS, get_backend
+
+SAMPLES = ["ก", "ข", "ไก่", "ไข่", "ควาย", "ช้าง", "อา", "เกาะ", "ผู้เฒ่า", "ฤดู"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark TTS backend latency")
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--lang", default="th")
+    parser.add_argument("--backend", action="append", choices=list(BACKENDS),
+                        help="backend to measure (default: every available one)")
+    args = parser.parse_args()
+
+    print(f"{'backend':>8}  {'calls':>5}  {'fail':>4}  {'mean ms':>8}  {'p50 ms':>8}  "
+          f"{'p95 ms':>8}  {'max ms':>8}")
+    for name in args.backend or BACKENDS:
+        backend = get_backend(name)
+        if not backend.available():
+            print(f"{name:>8}  not available")
+            continue
+        for _ in range(args.rounds):
+            for text in SAMPLES:
+                try:
+                    backend(text, args.lang, False)
+                except Exception:
+                    pass
+        stats = backend.stats()
+        print(f"{name:>8}  {stats['calls']:>5}  {stats['failures']:>4}  {stats['mean_ms']:>8.1f}  "
+              f"{stats['p50_ms']:>8.1f}  {stats['p95_ms']:>8.1f}  {stats['max_ms']:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+Japanese Flashcards - Confusable Distractors
+Precomputes, for every word, a short list of near-miss neighbors: words that
+share a kanji, have a similar kana reading, or a translation of similar
+length. Questions then draw their wrong answers from that list.
+
+Candidates come from inverted indexes (kanji character -> words, kana bigram
+-> words) rather than from all pairs, and blocks of words are scored in
+parallel worker processes, so the build scales to decks of 100k+ words.
+
+The lists are built when the vocabulary store is compiled and saved next to
+it (japanese_vocab.<language>.neighbors), so a quiz only loads them:
+
+    header     magic, version, neighbors per word, word count
+    neighbors  one fixed-width row of word IDs per word, padded with EMPTY
+"""
+
+import heapq
+import os
+import random
+import struct
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from japanese_distractors import column
+
+NEIGHBORS = 8
+MAX_POSTING = 32
+KANA_LIMIT = 2
+BLOCK_SIZE = 2048
+PARALLEL_THRESHOLD = 5000
+
+MAGIC = b"JNBR"
+VERSION = 1
+HEADER = struct.Struct("<4sHHI")
+EMPTY = 0xFFFFFFFF
+
+
+def bounded_edit_distance(a, b, limit):
+    """Levenshtein distance between a and b, or limit + 1 once it exceeds limit.
+
+    Only the diagonal band of width 2 * limit + 1 is filled, and the scan
+    stops as soon as a whole row is past the limit.
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    if len(a) > len(b):
+        a, b = b, a
+    too_far = limit + 1
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        lo = max(1, i - limit)
+        hi = min(len(b), i + limit)
+        current = [too_far] * (len(b) + 1)
+        if lo == 1:
+            current[0] = i
+        best = current[0]
+        ca = a[i - 1]
+        for j in range(lo, hi + 1):
+            value = previous[j - 1] + (ca != b[j - 1])
+            if previous[j] + 1 < value:
+                value = previous[j] + 1
+            if current[j - 1] + 1 < value:
+                value = current[j - 1] + 1
+            if value > too_far:
+                value = too_far
+            current[j] = value
+            if value < best:
+                best = value
+        if best > limit:
+            return too_far
+        previous = current
+    return min(previous[len(b)], too_far)
+
+
+def is_kanji(char):
+    """True for CJK ideographs (including the iteration mark 々)"""
+    return "一" <= char <= "鿿" or "㐀" <= char <= "䶿" or char == "々"
+
+
+def bigrams(text):
+    """Overlapping character pairs of text (the text itself if shorter)"""
+    return [text[i:i + 2] for i in range(len(text) - 1)] or [text]
+
+
+def build_postings(kanji_sets, kana):
+    """Inverted indexes from kanji character and kana bigram to word IDs"""
+    by_kanji = {}
+    by_kana = {}
+    for word_id, (chars, r) in enumerate(zip(kanji_sets, kana)):
+        for char in chars:
+            by_kanji.setdefault(char, []).append(word_id)
+        for pair in set(bigrams(r)):
+            by_kana.setdefault(pair, []).append(word_id)
+    return by_kanji, by_kana
+
+
+# Deck columns shared with worker processes (set once per process)
+_deck = None
+
+
+def _init_worker(deck):
+    global _deck
+    _deck = deck
+
+
+def _hits(postings, rng):
+    """Count how many of the given postings each word appears in"""
+    counts = {}
+    for ids in postings:
+        if len(ids) > MAX_POSTING:
+            ids = rng.sample(ids, MAX_POSTING)
+        for other in ids:
+            counts[other] = counts.get(other, 0) + 1
+    return counts
+
+
+def _length_score(answers, word_id, other):
+    length_a, length_b = len(answers[word_id]), len(answers[other])
+    return 1 - abs(length_a - length_b) / max(length_a, length_b, 1)
+
+
+def _neighbors_for_block(start, stop, k):
+    kanji, kanji_sets, kana, answers, by_kanji, by_kana, by_length = _deck
+    block = []
+    for word_id in range(start, stop):
+        rng = random.Random(word_id)
+        kanji_hits = _hits([by_kanji[c] for c in sorted(kanji_sets[word_id])], rng)
+        kana_hits = _hits([by_kana[p] for p in sorted(set(bigrams(kana[word_id])))], rng)
+        candidates = set(kanji_hits) | set(kana_hits)
+        if len(candidates) < 2 * k:
+            same_length = by_length.get(len(answers[word_id]), [])
+            candidates.update(rng.sample(same_length, min(len(same_length), 4 * k)))
+        candidates = [
+            other for other in candidates
+            if kanji[other] != kanji[word_id] and answers[other] != answers[word_id]
+        ]
+
+        # Coarse rank on posting hits, which come for free from the indexes,
+        # then re-rank a short list with the exact kana edit distance
+        def coarse(other):
+            return (2 * kanji_hits.get(other, 0) + kana_hits.get(other, 0)
+                    + _length_score(answers, word_id, other))
+
+        def exact(other):
+            distance = bounded_edit_distance(kana[word_id], kana[other], KANA_LIMIT)
+            return (2 * kanji_hits.get(other, 0)
+                    + 2 * (KANA_LIMIT + 1 - distance) / (KANA_LIMIT + 1)
+                    + _length_score(answers, word_id, other), -other)
+
+        shortlist = heapq.nlargest(3 * k, candidates, key=coarse)
+        ranked = sorted(shortlist, key=exact, reverse=True)
+
+        # Duplicate entries share a translation; keep one neighbor per answer
+        best = []
+        seen = set()
+        for other in ranked:
+            if answers[other] not in seen:
+                seen.add(answers[other])
+                best.append(other)
+                if len(best) == k:
+                    break
+        block.append(tuple(best))
+    return start, block
+
+
+def build_neighbors(vocabulary, language, k=NEIGHBORS, workers=None):
+    """Return a list with the top-k confusable word IDs for every word"""
+    kanji = list(column(vocabulary, "kanji"))
+    kana = list(column(vocabulary, "kana"))
+    answers = list(column(vocabulary, language))
+    kanji_sets = [frozenset(c for c in text if is_kanji(c)) for text in kanji]
+    by_kanji, by_kana = build_postings(kanji_sets, kana)
+    by_length = {}
+    for word_id, answer in enumerate(answers):
+        by_length.setdefault(len(answer), []).append(word_id)
+    deck = (kanji, kanji_sets, kana, answers, by_kanji, by_kana, by_length)
+
+    n = len(kanji)
+    blocks = [(start, min(start + BLOCK_SIZE, n)) for start in range(0, n, BLOCK_SIZE)]
+    neighbors = [()] * n
+
+    if workers == 1 or n < PARALLEL_THRESHOLD:
+        _init_worker(deck)
+        results = [_neighbors_for_block(start, stop, k) for start, stop in blocks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count(),
+                                 initializer=_init_worker, initargs=(deck,)) as pool:
+            futures = [pool.submit(_neighbors_for_block, start, stop, k) for start, stop in blocks]
+            results = [future.result() for future in futures]
+
+    for start, block in results:
+        neighbors[start:start + len(block)] = block
+    return neighbors
+
+
+def pack_neighbors(neighbors, k=NEIGHBORS):
+    """Flatten neighbor lists into one array of k IDs per word"""
+    flat = array("I", [EMPTY]) * (len(neighbors) * k)
+    for word_id, ids in enumerate(neighbors):
+        flat[word_id * k:word_id * k + len(ids)] = array("I", ids[:k])
+    return flat
+
+
+def neighbors_path(store_path, language):
+    """Path of the saved neighbor lists for one language, next to the store"""
+    store_path = Path(store_path)
+    return store_path.with_name(f"{store_path.stem}.{language}.neighbors")
+
+
+def save_neighbors(flat, path, k=NEIGHBORS):
+    """Write packed neighbor lists to path (atomically replaced)"""
+    path = Path(path)
+    data = array("I", flat)
+    if sys.byteorder != "little":
+        data.byteswap()
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, k, len(flat) // k))
+        f.write(data.tobytes())
+    os.replace(tmp_path, path)
+    return path
+
+
+def load_neighbors(path, count, k=NEIGHBORS, sources=()):
+    """Packed neighbor lists saved at path, or None if they are missing, were
+    built for another deck, or are older than any of the sources"""
+    path = Path(path)
+    try:
+        built = path.stat().st_mtime
+        if any(Path(source).stat().st_mtime > built for source in sources):
+            return None
+        data = path.read_bytes()
+    except FileNotFoundError:
+        return None
+    if len(data) != HEADER.size + count * k * 4:
+        return None
+    if HEADER.unpack_from(data) != (MAGIC, VERSION, k, count):
+        return None
+    flat = array("I")
+    flat.frombytes(data[HEADER.size:])
+    if sys.byteorder != "little":
+        flat.byteswap()
+    return flat
+
+
+class ConfusableIndex:
+    """Precomputed near-miss neighbors for one target language.
+
+    For a compiled store the lists are loaded from the file saved next to it,
+    and only built (then saved) when that file is missing or stale.
+    """
+
+    def __init__(self, vocabulary, language, k=NEIGHBORS, workers=None):
+        self.vocabulary = vocabulary
+        self.language = language
+        self.k = k
+        self._field = getattr(vocabulary, "field", None) or (lambda i, name: vocabulary[i][name])
+
+        store_path = getattr(vocabulary, "path", None)
+        path = None
+        self.flat = None
+        if store_path is not None:
+            path = neighbors_path(store_path, language)
+            self.flat = load_neighbors(path, len(vocabulary), k, (store_path, __file__))
+        if self.flat is None:
+            self.flat = pack_neighbors(build_neighbors(vocabulary, language, k, workers), k)
+            if path is not None:
+                save_neighbors(self.flat, path, k)
+
+    def neighbors(self, word_id):
+        """IDs of the words most easily confused with word_id, best first"""
+        row = self.flat[word_id * self.k:(word_id + 1) * self.k]
+        return [other for other in row if other != EMPTY]
+
+    def draw(self, word_id, excluded, k=3, rng=random):
+        """Return up to k distinct confusable translations, none in excluded"""
+        picks = []
+        seen = set(excluded)
+        candidates = self.neighbors(word_id)
+        rng.shuffle(candidates)
+        for other in candidates:
+            value = self._field(other, self.language)
+            if value not in seen:
+                seen.add(value)
+                picks.append(value)
+                if len(picks) == k:
+                    break
+        return picks
+
+
+def main():
+    """Build neighbor lists for the current deck and report timing"""
+    import argparse
+    import time
+
+    from japanese_vocab_store import open_vocabulary
+
+    parser = argparse.ArgumentParser(description="Build confusable-distractor neighbor lists")
+    parser.add_argument("--language", default="english",
+                        choices=["english", "thai", "arabic", "russian"])
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--show", type=int, default=5, help="number of sample words to print")
+    args = parser.parse_args()
+
+    vocabulary = open_vocabulary()
+    start = time.perf_counter()
+    neighbors = build_neighbors(vocabulary, args.language, workers=args.workers)
+    elapsed = time.perf_counter() - start
+    print(f"Built neighbors for {len(vocabulary)} words in {elapsed:.2f}s")
+
+    for word_id in random.sample(range(len(vocabulary)), args.show):
+        word = vocabulary[word_id]
+        near = ", ".join(f"{vocabulary[o]['kanji']} ({vocabulary[o][args.language]})"
+                         for o in neighbors[word_id])
+        print(f"  {word['kanji']} ({word[args.language]}): {near}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Japanese Flashcards - Distractor Index
+Per-field tables of distinct answer strings and the word IDs behind each one,
+built once at load and sampled in O(k) per question without copying or
+shuffling the deck.
+"""
+
+import random
+
+
+def column(vocabulary, name):
+    """Yield one field of every entry, decoding only that field when possible"""
+    field = getattr(vocabulary, "field", None)
+    if field is not None:
+        for i in range(len(vocabulary)):
+            yield field(i, name)
+    else:
+        for word in vocabulary:
+            yield word[name]
+
+
+class DistractorIndex:
+    """Distinct values of one field, each mapped to the IDs of its words"""
+
+    def __init__(self, vocabulary, language):
+        self.language = language
+        self.values = []
+        self.positions = {}
+        self.ids = []
+        for word_id, value in enumerate(column(vocabulary, language)):
+            pos = self.positions.get(value)
+            if pos is None:
+                self.positions[value] = len(self.values)
+                self.values.append(value)
+                self.ids.append([word_id])
+            else:
+                self.ids[pos].append(word_id)
+        self.ids = [tuple(ids) for ids in self.ids]
+
+    def __len__(self):
+        return len(self.values)
+
+    def ids_for(self, value):
+        """Return the IDs of every word whose field equals value"""
+        pos = self.positions.get(value)
+        return self.ids[pos] if pos is not None else ()
+
+    def draw(self, excluded, k=3, rng=random):
+        """Return up to k distinct values, none of them in excluded"""
+        n = len(self.values)
+        skip = {self.positions[v] for v in excluded if v in self.positions}
+        # random.sample over a range picks positions in O(k) time; drawing
+        # len(skip) spares covers the case where excluded values are drawn
+        picks = rng.sample(range(n), min(k + len(skip), n))
+        return [self.values[p] for p in picks if p not in skip][:k]
@@ -5,8 +5,9 @@ A simple multiple-choice quiz game to learn Japanese vocabulary
 """
 
 import random
-import os
 import sys
+import time
+from collections import namedtuple
 
 # ANSI color codes for terminal formatting
 class Colors:
@@ -20,15 +21,24 @@ class Colors:
     BOLD = '\033[1m'
     UNDERLINE = '\033[4m'
 
-# Import vocabulary from external files
-from japanese_vocab_part1 import VOCAB_PART1
-from japanese_vocab_part2 import VOCAB_PART2
-from japanese_vocab_part3 import VOCAB_PART3
-from japanese_vocab_part4 import VOCAB_PART4
-from japanese_vocab_part5 import VOCAB_PART5
-
-# Combine all vocabulary parts
-VOCABULARY = VOCAB_PART1 + VOCAB_PART2 + VOCAB_PART3 + VOCAB_PART4 + VOCAB_PART5
+# Load vocabulary from the compiled store (rebuilt from the
+# japanese_vocab_partX.py files whenever they change)
+from japanese_vocab_store import open_vocabulary
+from japanese_distractors import DistractorIndex
+from japanese_confusables import ConfusableIndex, is_kanji
+from japanese_kanji_index import KanjiIndex
+from japanese_readings import ReadingIndex
+from japanese_romaji import reading_distance, to_kana
+from spaced_repetition import Scheduler
+from progress_store import ProgressStore
+from terminal_render import Screen
+from terminal_input import pause, read_choice
+
+VOCABULARY = open_vocabulary()
+# Kanji character -> words containing it, for the family quiz and lookup
+KANJI_INDEX = KanjiIndex(VOCABULARY)
+# Kana readings bucketed by mora count and leading kana, for the reading quiz
+READING_INDEX = ReadingIndex(VOCABULARY)
 
 # Original vocabulary for reference (commented out)
 """
@@ -216,6 +226,15 @@ VOCABULARY_OLD = [
 ]
 """
 
+ACTIVITIES = {
+    "1": ("translate", "Translation quiz"),
+    "2": ("reverse", "Reverse quiz - pick the Japanese word for a translation"),
+    "3": ("reading", "Reading quiz - pick the kana reading of a kanji word"),
+    "4": ("typed", "Typed reading - type the reading in romaji or kana"),
+    "5": ("kanji-family", "Kanji family quiz - tell apart words that share a kanji"),
+    "6": ("lookup", "Kanji lookup - every word written with a kanji")
+}
+
 LANGUAGES = {
     "1": ("english", "English"),
     "2": ("thai", "ไทย (Thai)"),
@@ -223,19 +242,48 @@ LANGUAGES = {
     "4": ("russian", "Русский (Russian)")
 }
 
+DISTRACTOR_MODES = {
+    "1": ("random", "Random - wrong answers from the whole deck"),
+    "2": ("confusable", "Confusable - near-miss answers (N1 challenge)")
+}
+
+
+# Question frames are at most 16 lines, so with the 8 rows kept for the
+# answer prompt and feedback a question fits on a 24-row terminal
+SCREEN = Screen(reserve=8)
+
 
 def clear_screen():
     """Clear the terminal screen"""
-    os.system('clear' if os.name != 'nt' else 'cls')
+    SCREEN.clear()
+
+
+def header_lines():
+    """Lines of the application header"""
+    return [
+        f"{Colors.HEADER}{Colors.BOLD}{'=' * 60}{Colors.ENDC}",
+        f"{Colors.HEADER}{Colors.BOLD}    🇯🇵  JAPANESE LANGUAGE FLASHCARDS  🇯🇵{Colors.ENDC}",
+        f"{Colors.HEADER}{Colors.BOLD}{'=' * 60}{Colors.ENDC}",
+    ]
 
 
 def print_header():
     """Print the application header"""
-    print(f"{Colors.HEADER}{Colors.BOLD}")
-    print("=" * 60)
-    print("    🇯🇵  JAPANESE LANGUAGE FLASHCARDS  🇯🇵")
-    print("=" * 60)
-    print(f"{Colors.ENDC}")
+    for line in [""] + header_lines() + [""]:
+        print(line)
+
+
+def select_activity():
+    """Let user select what to practice"""
+    print(f"\n{Colors.OKCYAN}What would you like to do?{Colors.ENDC}")
+    for key, (_, name) in ACTIVITIES.items():
+        print(f"  {key}. {name}")
+
+    while True:
+        choice = input(f"\n{Colors.BOLD}Enter your choice (1-{len(ACTIVITIES)}): {Colors.ENDC}").strip()
+        if choice in ACTIVITIES:
+            return ACTIVITIES[choice][0]
+        print(f"{Colors.FAIL}Invalid choice. Please select 1-{len(ACTIVITIES)}.{Colors.ENDC}")
 
 
 def select_language():
@@ -251,87 +299,444 @@ def select_language():
         print(f"{Colors.FAIL}Invalid choice. Please select 1-4.{Colors.ENDC}")
 
 
-def generate_choices(correct_word, target_language):
-    """Generate 4 choices (1 correct + 3 wrong)"""
-    correct_answer = correct_word[target_language]
+# Value -> word ID indexes, built on first use for each field
+_distractor_indexes = {}
+
+
+def distractor_index(field):
+    """Return the distractor index for a target language (or any field)"""
+    if field not in _distractor_indexes:
+        _distractor_indexes[field] = DistractorIndex(VOCABULARY, field)
+    return _distractor_indexes[field]
 
-    # Get wrong answers from other words
-    wrong_answers = [
-        word[target_language]
-        for word in VOCABULARY
-        if word["kanji"] != correct_word["kanji"]
-    ]
 
-    # Randomly select 3 wrong answers
-    random.shuffle(wrong_answers)
-    choices = [correct_answer] + wrong_answers[:3]
+# Confusable-neighbor indexes, loaded on first use for each target language
+# (the lists themselves are precomputed with the store)
+_confusable_indexes = {}
+
+
+def confusable_index(target_language):
+    """Return the confusable-distractor index for a target language"""
+    if target_language not in _confusable_indexes:
+        _confusable_indexes[target_language] = ConfusableIndex(VOCABULARY, target_language)
+    return _confusable_indexes[target_language]
+
+
+def card_key(word_id):
+    """Progress key for a word: its kanji and kana rather than its position,
+    so saved schedules stay with the word when the deck grows or is reordered"""
+    return f"{VOCABULARY.field(word_id, 'kanji')}\t{VOCABULARY.field(word_id, 'kana')}"
+
+
+# Progress key -> word ID, built on first use
+_card_ids = {}
+
+
+def word_id_for_key(key):
+    """Word ID for a saved progress key, or None if the word left the deck"""
+    if not _card_ids:
+        for word_id in range(len(VOCABULARY)):
+            # Where two entries are the same word, the first keeps the schedule
+            _card_ids.setdefault(card_key(word_id), word_id)
+    return _card_ids.get(key)
+
+
+def accepted_ids(word_id):
+    """IDs of every entry that counts as the same word (same kanji)"""
+    return distractor_index("kanji").ids_for(VOCABULARY.field(word_id, "kanji"))
+
+
+def generate_choices(word_id, target_language, distractors="random", rng=random):
+    """Generate 4 distinct choices (1 correct + 3 wrong)"""
+    correct_answer = VOCABULARY.field(word_id, target_language)
+
+    # Translations of other entries with the same kanji are also right,
+    # so they can never be offered as wrong answers
+    excluded = {VOCABULARY.field(i, target_language) for i in accepted_ids(word_id)}
+    wrong_answers = []
+    if distractors == "confusable":
+        wrong_answers = confusable_index(target_language).draw(word_id, excluded, 3, rng)
+    if len(wrong_answers) < 3:
+        excluded.update(wrong_answers)
+        wrong_answers += distractor_index(target_language).draw(excluded, 3 - len(wrong_answers), rng)
+    choices = [correct_answer] + wrong_answers
 
     # Shuffle all choices
-    random.shuffle(choices)
+    rng.shuffle(choices)
 
     return choices, correct_answer
 
 
-def display_question(word, question_num, total_questions):
-    """Display the Japanese word with kanji, kana, and romaji"""
-    print(f"\n{Colors.BOLD}Question {question_num}/{total_questions}{Colors.ENDC}")
-    print("─" * 60)
-    print(f"\n{Colors.HEADER}{Colors.BOLD}  {word['kanji']}{Colors.ENDC}")
-    print(f"{Colors.OKCYAN}  {word['kana']}{Colors.ENDC}")
-    print(f"{Colors.WARNING}  {word['romaji']}{Colors.ENDC}\n")
-    print("─" * 60)
+def is_correct_choice(word_id, choice, target_language):
+    """Grade a choice by the word IDs behind it rather than by its text"""
+    choice_ids = distractor_index(target_language).ids_for(choice)
+    return not set(accepted_ids(word_id)).isdisjoint(choice_ids)
+
+
+Question = namedtuple("Question", "number word_id choices correct_answer")
+Answer = namedtuple("Answer", "word_id choice correct_answer is_correct latency_ns",
+                    defaults=(None,))
+
+
+class QuizSession:
+    """Quiz state machine with no terminal I/O.
+
+    Front ends call next_question(), show it however they like, and pass the
+    chosen index (0-based) to submit_answer(). Everything is pure CPU, so a
+    session can also be driven in a tight loop for load and regression runs.
+
+    With a scheduler, questions are the cards it has due and every answer is
+    recorded as a review; otherwise words are sampled at random.
+    """
+
+    def __init__(self, target_language, num_questions=10, distractors="random",
+                 rng=random, word_ids=None, scheduler=None, now=None):
+        self.target_language = target_language
+        self.distractors = distractors
+        self.rng = rng
+        self.scheduler = scheduler
+        self.now = now
+        if word_ids is None and scheduler is not None:
+            word_ids = scheduler.next_cards(num_questions, now)
+        elif word_ids is None:
+            word_ids = rng.sample(range(len(VOCABULARY)), min(num_questions, len(VOCABULARY)))
+        self.word_ids = list(word_ids)
+        self.total = len(self.word_ids)
+        self.score = 0
+        self.history = []
+        self.current = None
+
+    @property
+    def answered(self):
+        return len(self.history)
+
+    @property
+    def finished(self):
+        return self.answered >= self.total
+
+    def next_question(self):
+        """Return the next Question, or None once every question is answered"""
+        if self.current is not None:
+            return self.current
+        if self.finished:
+            return None
+        word_id = self.word_ids[self.answered]
+        choices, correct_answer = self.make_choices(word_id)
+        self.current = Question(self.answered + 1, word_id, choices, correct_answer)
+        return self.current
+
+    def make_choices(self, word_id):
+        """Return (choices, correct_answer) for the word being asked"""
+        return generate_choices(word_id, self.target_language, self.distractors, self.rng)
+
+    def grade(self, word_id, choice):
+        """True if choice is a right answer for the word"""
+        return is_correct_choice(word_id, choice, self.target_language)
+
+    def submit_answer(self, index, latency_ns=None):
+        """Grade the choice at index for the current question.
+
+        latency_ns is the learner's reaction time, kept in the history.
+        """
+        question = self.current
+        if question is None:
+            raise RuntimeError("No question is waiting for an answer")
+        if not 0 <= index < len(question.choices):
+            raise ValueError(f"Choice index {index} out of range")
+        choice = question.choices[index]
+        return self._record(question, choice, self.grade(question.word_id, choice), latency_ns)
+
+    def _record(self, question, choice, is_correct, latency_ns):
+        if is_correct:
+            self.score += 1
+        if self.scheduler is not None:
+            self.scheduler.review(question.word_id, is_correct, self.now)
+        answer = Answer(question.word_id, choice, question.correct_answer, is_correct,
+                        latency_ns)
+        self.history.append(answer)
+        self.current = None
+        return answer
+
+
+class ReverseSession(QuizSession):
+    """Quiz from the target language back to Japanese: the translation is
+    shown and the answer is the kanji.
+
+    Many words share a translation, so every word behind the prompt is a
+    right answer and never a distractor; both come from the value -> IDs
+    indexes, without scanning the deck.
+    """
+
+    def prompt_ids(self, word_id):
+        """IDs of every word with the same translation as word_id"""
+        prompt = VOCABULARY.field(word_id, self.target_language)
+        return distractor_index(self.target_language).ids_for(prompt)
+
+    def make_choices(self, word_id):
+        correct_answer = VOCABULARY.field(word_id, "kanji")
+        excluded = {VOCABULARY.field(i, "kanji") for i in self.prompt_ids(word_id)}
+        wrong_answers = []
+        if self.distractors == "confusable":
+            neighbors = confusable_index(self.target_language).neighbors(word_id)
+            self.rng.shuffle(neighbors)
+            for other in neighbors:
+                text = VOCABULARY.field(other, "kanji")
+                if len(wrong_answers) < 3 and text not in excluded:
+                    excluded.add(text)
+                    wrong_answers.append(text)
+        if len(wrong_answers) < 3:
+            excluded.update(wrong_answers)
+            wrong_answers += distractor_index("kanji").draw(excluded, 3 - len(wrong_answers), self.rng)
+        choices = [correct_answer] + wrong_answers
+        self.rng.shuffle(choices)
+        return choices, correct_answer
+
+    def grade(self, word_id, choice):
+        choice_ids = distractor_index("kanji").ids_for(choice)
+        return not set(self.prompt_ids(word_id)).isdisjoint(choice_ids)
+
+
+class KanjiFamilySession(ReverseSession):
+    """Quiz on words that share a kanji: given a translation, pick its word
+    from the others written with the same kanji.
+
+    Family members often share a translation (原則 and 原理), so as in the
+    reverse quiz every word behind the prompt is right and none is a distractor.
+    """
+
+    def __init__(self, target_language, num_questions=10, rng=random):
+        # One question per kanji, each on a random word of its family
+        families = KANJI_INDEX.families()
+        chars = rng.sample(families, min(num_questions, len(families)))
+        self.focus = chars
+        super().__init__(target_language, num_questions, rng=rng,
+                         word_ids=[rng.choice(KANJI_INDEX.ids_for(c)) for c in chars])
+
+    def make_choices(self, word_id):
+        correct_answer = VOCABULARY.field(word_id, "kanji")
+        char = self.focus[self.answered]
+        # The rest of the family first, then words sharing the word's other
+        # kanji, then any word
+        chars = [char] + [c for c in dict.fromkeys(correct_answer) if is_kanji(c) and c != char]
+        excluded = {VOCABULARY.field(i, "kanji") for i in self.prompt_ids(word_id)}
+        wrong_answers = []
+        for c in chars:
+            ids = list(KANJI_INDEX.ids_for(c))
+            self.rng.shuffle(ids)
+            for other in ids:
+                text = VOCABULARY.field(other, "kanji")
+                if len(wrong_answers) < 3 and text not in excluded:
+                    excluded.add(text)
+                    wrong_answers.append(text)
+        if len(wrong_answers) < 3:
+            wrong_answers += distractor_index("kanji").draw(excluded, 3 - len(wrong_answers), self.rng)
+        choices = [correct_answer] + wrong_answers
+        self.rng.shuffle(choices)
+        return choices, correct_answer
+
+
+class TypedSession(QuizSession):
+    """Quiz where the reading is typed, in romaji or kana, instead of chosen.
+
+    Run it with "kana" as the target language. Answers within a small edit
+    distance of an accepted reading count, so one slipped key is not fatal.
+    """
+
+    def make_choices(self, word_id):
+        return [], VOCABULARY.field(word_id, "kana")
+
+    def readings(self, word_id):
+        """Accepted readings: those of every entry with the same kanji"""
+        return list(dict.fromkeys(VOCABULARY.field(i, "kana") for i in accepted_ids(word_id)))
+
+    def grade(self, word_id, text):
+        return reading_distance(text, self.readings(word_id)) is not None
+
+    def submit_text(self, text, latency_ns=None):
+        """Grade a typed reading for the current question"""
+        question = self.current
+        if question is None:
+            raise RuntimeError("No question is waiting for an answer")
+        return self._record(question, text, self.grade(question.word_id, text), latency_ns)
+
+
+class ReadingSession(QuizSession):
+    """Quiz on readings: the kanji is shown alone and the answer is its kana.
+
+    Wrong answers are readings of the same length that start with the same
+    kana. Run it with "kana" as the target language, which also keys its
+    review schedule.
+    """
+
+    def make_choices(self, word_id):
+        correct_answer = VOCABULARY.field(word_id, "kana")
+        # Readings of other entries with the same kanji are also right
+        excluded = {VOCABULARY.field(i, "kana") for i in accepted_ids(word_id)}
+        choices = [correct_answer] + READING_INDEX.draw(correct_answer, excluded, 3, self.rng)
+        self.rng.shuffle(choices)
+        return choices, correct_answer
+
+
+def simulate(target_language, num_questions, accuracy=0.7, distractors="random",
+             session_length=10, seed=None):
+    """Answer num_questions questions headlessly and return (score, total).
+
+    A simulated learner picks the correct choice with probability accuracy
+    and a random choice otherwise.
+    """
+    rng = random.Random(seed)
+    score = total = 0
+    while total < num_questions:
+        session = QuizSession(target_language, min(session_length, num_questions - total),
+                              distractors, rng)
+        while (question := session.next_question()) is not None:
+            if rng.random() < accuracy:
+                index = question.choices.index(question.correct_answer)
+            else:
+                index = rng.randrange(len(question.choices))
+            session.submit_answer(index)
+        score += session.score
+        total += session.total
+    return score, total
+
+
+def select_distractors():
+    """Let user select how wrong answers are picked"""
+    print(f"\n{Colors.OKCYAN}Choose the difficulty of the wrong answers:{Colors.ENDC}")
+    for key, (_, name) in DISTRACTOR_MODES.items():
+        print(f"  {key}. {name}")
 
+    while True:
+        choice = input(f"\n{Colors.BOLD}Enter your choice (1-2): {Colors.ENDC}").strip()
+        if choice in DISTRACTOR_MODES:
+            return DISTRACTOR_MODES[choice][0]
+        print(f"{Colors.FAIL}Invalid choice. Please select 1-2.{Colors.ENDC}")
+
+
+def question_header(session, question):
+    """Header, question number and score: the top of every question frame"""
+    return header_lines() + [
+        "",
+        f"{Colors.BOLD}Question {question.number}/{session.total}  |  "
+        f"Score: {session.score}/{session.answered}{Colors.ENDC}",
+        "─" * 60,
+    ]
 
-def ask_question(word, target_language, question_num, total_questions):
-    """Ask a single question and return if answer was correct"""
-    display_question(word, question_num, total_questions)
 
-    choices, correct_answer = generate_choices(word, target_language)
+def question_lines(word, show_reading=True):
+    """Lines showing the Japanese word with kanji, kana, and romaji
+    (the kanji alone when the reading is the question)"""
+    lines = [f"{Colors.HEADER}{Colors.BOLD}  {word['kanji']}{Colors.ENDC}"]
+    if show_reading:
+        lines += [
+            f"{Colors.OKCYAN}  {word['kana']}{Colors.ENDC}",
+            f"{Colors.WARNING}  {word['romaji']}{Colors.ENDC}",
+        ]
+    return lines + ["─" * 60]
 
-    # Display choices
-    print(f"\n{Colors.BOLD}Choose the correct translation:{Colors.ENDC}\n")
-    for i, choice in enumerate(choices, 1):
-        print(f"  {i}. {choice}")
 
-    # Get user answer
-    while True:
-        try:
-            answer = input(f"\n{Colors.BOLD}Your answer (1-4): {Colors.ENDC}").strip()
-            answer_num = int(answer)
-            if 1 <= answer_num <= 4:
-                break
-            print(f"{Colors.FAIL}Please enter a number between 1 and 4.{Colors.ENDC}")
-        except ValueError:
-            print(f"{Colors.FAIL}Please enter a valid number.{Colors.ENDC}")
+def choice_lines(label, choices):
+    """The question asked and the numbered choices"""
+    return ["", f"{Colors.BOLD}{label}{Colors.ENDC}"] + [
+        f"  {i}. {choice}" for i, choice in enumerate(choices, 1)]
+
+
+def question_screen(session, question):
+    """Full frame for one question: header, score, word and choices"""
+    return (question_header(session, question)
+            + question_lines(VOCABULARY[question.word_id])
+            + choice_lines("Choose the correct translation:", question.choices))
+
+
+def reverse_screen(session, question):
+    """Full frame for one reverse question: the translation, then kanji choices"""
+    prompt = VOCABULARY.field(question.word_id, session.target_language)
+    return (question_header(session, question)
+            + [f"{Colors.HEADER}{Colors.BOLD}  {prompt}{Colors.ENDC}", "─" * 60]
+            + choice_lines("Choose the Japanese word:", question.choices))
+
+
+def reading_screen(session, question):
+    """Full frame for one reading question: the kanji without its reading"""
+    return (question_header(session, question)
+            + question_lines(VOCABULARY[question.word_id], show_reading=False)
+            + choice_lines("Choose the correct reading:", question.choices))
+
+
+def typed_screen(session, question):
+    """Full frame for one typed-reading question"""
+    return (question_header(session, question)
+            + question_lines(VOCABULARY[question.word_id], show_reading=False)
+            + choice_lines("Type the reading in romaji or kana:", []))
+
+
+def family_screen(session, question):
+    """Full frame for one kanji family question"""
+    char = session.focus[question.number - 1]
+    translation = VOCABULARY.field(question.word_id, session.target_language)
+    return (question_header(session, question) + [
+        f"{Colors.HEADER}{Colors.BOLD}  {char}{Colors.ENDC}  "
+        f"({KANJI_INDEX.count(char)} words in the deck)",
+        f"{Colors.OKCYAN}  {translation}{Colors.ENDC}",
+        "─" * 60,
+    ] + choice_lines("Which word is it?", question.choices))
+
+
+def ask_question(session, question, screen=question_screen):
+    """Ask a single question and return the graded Answer"""
+    SCREEN.render(screen(session, question))
+
+    # Get user answer: on a terminal a single keypress, timed from here
+    key, latency_ns = read_choice(
+        f"\n{Colors.BOLD}Your answer (1-4): {Colors.ENDC}", "1234",
+        f"{Colors.FAIL}Please enter a number between 1 and 4.{Colors.ENDC}")
 
     # Check answer
-    user_choice = choices[answer_num - 1]
-    is_correct = user_choice == correct_answer
+    result = session.submit_answer(int(key) - 1, latency_ns)
 
     print()
-    if is_correct:
+    if result.is_correct:
         print(f"{Colors.OKGREEN}{Colors.BOLD}✓ Correct!{Colors.ENDC}")
     else:
         print(f"{Colors.FAIL}{Colors.BOLD}✗ Incorrect{Colors.ENDC}")
-        print(f"{Colors.OKGREEN}The correct answer was: {correct_answer}{Colors.ENDC}")
+        print(f"{Colors.OKGREEN}The correct answer was: {result.correct_answer}{Colors.ENDC}")
+
+    # Brief pause to let user see the result (any key skips it)
+    pause(1.5)
+    return result
 
-    # Brief pause to let user see the result
-    import time
-    time.sleep(1.5)
-    return is_correct
+
+def ask_typed(session, question, screen=typed_screen):
+    """Ask for a typed reading and return the graded Answer"""
+    SCREEN.render(screen(session, question))
+    start_ns = time.perf_counter_ns()
+    text = input(f"\n{Colors.BOLD}Reading: {Colors.ENDC}")
+    latency_ns = time.perf_counter_ns() - start_ns
+
+    result = session.submit_text(text, latency_ns)
+    word = VOCABULARY[question.word_id]
+    reading = f"{word['kana']} ({word['romaji']})"
+
+    print()
+    if not result.is_correct:
+        print(f"{Colors.FAIL}{Colors.BOLD}✗ Incorrect{Colors.ENDC}")
+        if text.strip():
+            print(f"{Colors.WARNING}You typed: {to_kana(text)}{Colors.ENDC}")
+        print(f"{Colors.OKGREEN}The correct answer was: {reading}{Colors.ENDC}")
+    elif reading_distance(text, session.readings(question.word_id)) == 0:
+        print(f"{Colors.OKGREEN}{Colors.BOLD}✓ Correct!{Colors.ENDC}")
+    else:
+        print(f"{Colors.OKGREEN}{Colors.BOLD}✓ Close enough{Colors.ENDC} - it is spelled {reading}")
+    print(f"{Colors.OKCYAN}{word['english']}{Colors.ENDC}")
+
+    pause(1.5)
+    return result
 
 
 def show_final_score(score, total):
     """Display final score and result"""
-    clear_screen()
-    print_header()
-
     percentage = (score / total) * 100
 
-    print(f"\n{Colors.BOLD}{Colors.HEADER}{'=' * 60}{Colors.ENDC}")
-    print(f"{Colors.BOLD}{Colors.HEADER}                    QUIZ COMPLETE!{Colors.ENDC}")
-    print(f"{Colors.BOLD}{Colors.HEADER}{'=' * 60}{Colors.ENDC}\n")
-
     # Determine message based on score
     if percentage == 100:
         message = "Perfect! 🌟"
@@ -349,43 +754,133 @@ def show_final_score(score, total):
         message = "Don't give up! 📚"
         color = Colors.FAIL
 
-    print(f"{color}{Colors.BOLD}{message}{Colors.ENDC}\n")
-    print(f"{Colors.BOLD}You scored {score} out of {total} ({percentage:.0f}%){Colors.ENDC}\n")
-    print("─" * 60)
-
-
-def run_quiz(target_language, num_questions=10):
-    """Run the main quiz"""
-    # Select random questions
-    quiz_words = random.sample(VOCABULARY, min(num_questions, len(VOCABULARY)))
-    score = 0
-    total = len(quiz_words)
-
-    for i, word in enumerate(quiz_words, 1):
-        clear_screen()
-        print_header()
-        print(f"\n{Colors.BOLD}Score: {score}/{i-1}{Colors.ENDC}")
-
-        if ask_question(word, target_language, i, total):
-            score += 1
-
-    show_final_score(score, total)
-
-
-def main():
+    SCREEN.render(header_lines() + [
+        "",
+        f"{Colors.BOLD}{Colors.HEADER}{'=' * 60}{Colors.ENDC}",
+        f"{Colors.BOLD}{Colors.HEADER}                    QUIZ COMPLETE!{Colors.ENDC}",
+        f"{Colors.BOLD}{Colors.HEADER}{'=' * 60}{Colors.ENDC}",
+        "",
+        f"{color}{Colors.BOLD}{message}{Colors.ENDC}",
+        "",
+        f"{Colors.BOLD}You scored {score} out of {total} ({percentage:.0f}%){Colors.ENDC}",
+        "",
+        "─" * 60,
+    ])
+
+
+def run_quiz(target_language, num_questions=10, distractors="random", scheduler=None,
+             progress=None, session_class=QuizSession, screen=question_screen, deck=None,
+             ask=ask_question):
+    """Run the main quiz.
+
+    Progress is saved under deck (by default the target language), so each
+    kind of quiz keeps its own review schedule.
+    """
+    deck = deck or target_language
+    session = session_class(target_language, num_questions, distractors, scheduler=scheduler)
+    if progress is not None:
+        session_id = progress.start_session("japanese", deck)
+
+    while (question := session.next_question()) is not None:
+        answer = ask(session, question, screen)
+        if progress is not None and scheduler is not None:
+            progress.record_review(session_id, "japanese", deck,
+                                   scheduler.states[question.word_id], answer.is_correct,
+                                   latency_ms=answer.latency_ns / 1e6,
+                                   card_id=card_key(question.word_id))
+
+    if progress is not None:
+        progress.end_session(session_id, session.score, session.total)
+    show_final_score(session.score, session.total)
+
+
+def run_family_quiz(target_language, num_questions=10, progress=None):
+    """Run the kanji family quiz"""
+    session = KanjiFamilySession(target_language, num_questions)
+    if progress is not None:
+        session_id = progress.start_session("japanese", "kanji-family")
+
+    while (question := session.next_question()) is not None:
+        ask_question(session, question, family_screen)
+
+    if progress is not None:
+        progress.end_session(session_id, session.score, session.total)
+    show_final_score(session.score, session.total)
+
+
+def kanji_lookup(target_language="english"):
+    """Look up the words written with each kanji the user types"""
+    print(f"\n{Colors.OKCYAN}Type kanji (or whole words) to see every word that uses them.{Colors.ENDC}")
+    while True:
+        text = input(f"\n{Colors.BOLD}Kanji to look up (Enter to go back): {Colors.ENDC}").strip()
+        if not text:
+            return
+        chars = [c for c in dict.fromkeys(text) if is_kanji(c)]
+        if not chars:
+            print(f"{Colors.FAIL}No kanji in {text!r}.{Colors.ENDC}")
+        for char in chars:
+            ids = KANJI_INDEX.ids_for(char)
+            print(f"\n{Colors.HEADER}{Colors.BOLD}{char}{Colors.ENDC}  {len(ids)} word(s)")
+            for word_id in ids:
+                word = VOCABULARY[word_id]
+                print(f"  {word['kanji']}  {Colors.OKCYAN}{word['kana']}{Colors.ENDC}  "
+                      f"{word[target_language]}")
+
+
+def main(progress):
     """Main application loop"""
+    # One review schedule per deck (answer language and direction), restored
+    # from saved progress
+    schedulers = {}
+
     while True:
         clear_screen()
         print_header()
 
-        target_language = select_language()
+        activity = select_activity()
+        if activity == "lookup":
+            kanji_lookup()
+            continue
+
+        distractors = "random"
+        if activity in ("reading", "typed"):
+            target_language = "kana"
+        else:
+            target_language = select_language()
+            if activity in ("translate", "reverse"):
+                distractors = select_distractors()
+        if activity == "reverse":
+            deck = f"reverse-{target_language}"
+        elif activity == "typed":
+            deck = "typed-kana"
+        else:
+            deck = target_language
 
         clear_screen()
         print_header()
         print(f"\n{Colors.OKCYAN}Starting quiz with answers in {target_language}...{Colors.ENDC}")
         input(f"{Colors.OKCYAN}Press Enter to begin!{Colors.ENDC}")
 
-        run_quiz(target_language)
+        if activity == "kanji-family":
+            run_family_quiz(target_language, progress=progress)
+        else:
+            if deck not in schedulers:
+                states = progress.load_states("japanese", deck, key=word_id_for_key)
+                schedulers[deck] = Scheduler(range(len(VOCABULARY)), states)
+            if activity == "reading":
+                run_quiz(target_language, scheduler=schedulers[deck],
+                         progress=progress, session_class=ReadingSession, screen=reading_screen)
+            elif activity == "typed":
+                run_quiz(target_language, scheduler=schedulers[deck], progress=progress,
+                         session_class=TypedSession, screen=typed_screen, deck=deck,
+                         ask=ask_typed)
+            elif activity == "reverse":
+                run_quiz(target_language, distractors=distractors, scheduler=schedulers[deck],
+                         progress=progress, session_class=ReverseSession, screen=reverse_screen,
+                         deck=deck)
+            else:
+                run_quiz(target_language, distractors=distractors,
+                         scheduler=schedulers[deck], progress=progress)
 
         # Ask if user wants to play again
         print()
@@ -396,8 +891,11 @@ def main():
 
 
 if __name__ == "__main__":
+    progress = ProgressStore()
     try:
-        main()
+        main(progress)
     except KeyboardInterrupt:
         print(f"\n\n{Colors.WARNING}Quiz interrupted. See you next time!{Colors.ENDC}\n")
         sys.exit(0)
+    finally:
+        progress.close()
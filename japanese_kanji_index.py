@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Japanese Flashcards - Kanji Index
+Inverted index from each kanji character to the words that contain it, so
+顕 finds 顕著 and 顕在 without scanning the deck.
+
+The postings are stored as two flat arrays of unsigned ints (CSR layout):
+`postings` holds every word ID grouped by kanji, and `offsets` marks where
+each kanji's run starts. A lookup is one dict probe and one slice.
+
+    python3 japanese_kanji_index.py 顕 潜      # list the words for each kanji
+"""
+
+from array import array
+
+from japanese_confusables import is_kanji
+from japanese_distractors import column
+
+
+class KanjiIndex:
+    """Kanji character -> IDs of the words containing it"""
+
+    def __init__(self, vocabulary):
+        lists = {}
+        for word_id, text in enumerate(column(vocabulary, "kanji")):
+            # A kanji written twice in one word is posted once
+            for char in dict.fromkeys(c for c in text if is_kanji(c)):
+                lists.setdefault(char, []).append(word_id)
+
+        self.slots = {}
+        self.offsets = array("I", [0])
+        self.postings = array("I")
+        for char, ids in lists.items():
+            self.slots[char] = len(self.slots)
+            self.postings.extend(ids)
+            self.offsets.append(len(self.postings))
+
+    def __len__(self):
+        return len(self.slots)
+
+    def __contains__(self, char):
+        return char in self.slots
+
+    def ids_for(self, char):
+        """IDs of every word containing char, in deck order"""
+        slot = self.slots.get(char)
+        if slot is None:
+            return array("I")
+        return self.postings[self.offsets[slot]:self.offsets[slot + 1]]
+
+    def count(self, char):
+        """Number of words containing char"""
+        slot = self.slots.get(char)
+        return 0 if slot is None else self.offsets[slot + 1] - self.offsets[slot]
+
+    def families(self, min_size=2):
+        """Kanji shared by at least min_size words"""
+        return [char for char, slot in self.slots.items()
+                if self.offsets[slot + 1] - self.offsets[slot] >= min_size]
+
+
+def main():
+    """Look up the words for each kanji given on the command line"""
+    import argparse
+
+    from japanese_vocab_store import open_vocabulary
+
+    parser = argparse.ArgumentParser(description="List the words that contain each kanji")
+    parser.add_argument("text", nargs="*", help="kanji (or words) to look up")
+    parser.add_argument("--language", default="english",
+                        choices=["english", "thai", "arabic", "russian"])
+    args = parser.parse_args()
+
+    vocabulary = open_vocabulary()
+    index = KanjiIndex(vocabulary)
+    if not args.text:
+        families = index.families()
+        print(f"{len(index)} kanji in {len(vocabulary)} words; "
+              f"{len(families)} are shared by two or more words")
+        return
+    for char in (c for text in args.text for c in text if is_kanji(c)):
+        ids = index.ids_for(char)
+        print(f"{char}: {len(ids)} words")
+        for word_id in ids:
+            word = vocabulary[word_id]
+            print(f"    {word['kanji']} ({word['kana']}) - {word[args.language]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Japanese Flashcards - Reading Distractors
+Distinct kana readings bucketed by mora count and leading kana, built once at
+load. A reading question draws its wrong answers from the bucket of the right
+answer, so they look and sound alike, and the draw is O(k) however large the
+deck gets.
+"""
+
+import random
+
+from japanese_distractors import column
+
+# Small kana that merge with the kana before them into one mora (きゃ, ティ)
+SMALL_KANA = set("ゃゅょぁぃぅぇぉゎャュョァィゥェォヮ")
+
+
+def mora_count(kana):
+    """Number of morae in a kana reading (っ, ん and ー count as one each)"""
+    return sum(1 for char in kana if char not in SMALL_KANA)
+
+
+def sample_values(values, excluded, k, rng):
+    """Up to k of values, none in excluded, picked in O(k + len(excluded))"""
+    picks = rng.sample(range(len(values)), min(k + len(excluded), len(values)))
+    return [values[p] for p in picks if values[p] not in excluded][:k]
+
+
+class ReadingIndex:
+    """Distinct readings grouped by (mora count, leading kana) and by mora count"""
+
+    def __init__(self, vocabulary):
+        self.by_shape = {}
+        self.by_mora = {}
+        seen = set()
+        for kana in column(vocabulary, "kana"):
+            if kana in seen or not kana:
+                continue
+            seen.add(kana)
+            morae = mora_count(kana)
+            self.by_shape.setdefault((morae, kana[0]), []).append(kana)
+            self.by_mora.setdefault(morae, []).append(kana)
+        self.readings = list(seen)
+
+    def draw(self, kana, excluded, k=3, rng=random):
+        """Up to k readings like kana (same mora count and leading kana
+        first, then same mora count, then any), none of them in excluded"""
+        excluded = set(excluded) | {kana}
+        morae = mora_count(kana)
+        picks = []
+        for values in (self.by_shape.get((morae, kana[:1]), ()), self.by_mora.get(morae, ()),
+                       self.readings):
+            picks += sample_values(values, excluded, k - len(picks), rng)
+            if len(picks) == k:
+                break
+            excluded.update(picks)
+        return picks
@@ -0,0 +1,244 @@
+"""
+Japanese Flashcards - Romaji and Kana
+Turns a typed reading (Hepburn or Kunrei romaji, hiragana or katakana) into
+hiragana and grades it against the `kana` field.
+
+Romaji is converted by longest match over a trie compiled at import from the
+Hepburn table plus the usual variant spellings (si, tu, zya, ...). Long
+vowels are folded to ー on both sides before comparing, so chūshō, chuushou
+and chuushoo all match ちゅうしょう, and a small typo is still accepted
+through a banded edit distance.
+
+The same table runs the other way in to_romaji, which the vocabulary store
+uses to derive each word's romaji from its kana when the deck is compiled.
+"""
+
+import re
+import unicodedata
+
+from japanese_confusables import bounded_edit_distance
+
+# Hiragana -> Hepburn romaji
+HEPBURN = {
+    "あ": "a", "い": "i", "う": "u", "え": "e", "お": "o",
+    "か": "ka", "き": "ki", "く": "ku", "け": "ke", "こ": "ko",
+    "さ": "sa", "し": "shi", "す": "su", "せ": "se", "そ": "so",
+    "た": "ta", "ち": "chi", "つ": "tsu", "て": "te", "と": "to",
+    "な": "na", "に": "ni", "ぬ": "nu", "ね": "ne", "の": "no",
+    "は": "ha", "ひ": "hi", "ふ": "fu", "へ": "he", "ほ": "ho",
+    "ま": "ma", "み": "mi", "む": "mu", "め": "me", "も": "mo",
+    "や": "ya", "ゆ": "yu", "よ": "yo",
+    "ら": "ra", "り": "ri", "る": "ru", "れ": "re", "ろ": "ro",
+    "わ": "wa", "を": "o", "ん": "n",
+    "が": "ga", "ぎ": "gi", "ぐ": "gu", "げ": "ge", "ご": "go",
+    "ざ": "za", "じ": "ji", "ず": "zu", "ぜ": "ze", "ぞ": "zo",
+    "だ": "da", "ぢ": "ji", "づ": "zu", "で": "de", "ど": "do",
+    "ば": "ba", "び": "bi", "ぶ": "bu", "べ": "be", "ぼ": "bo",
+    "ぱ": "pa", "ぴ": "pi", "ぷ": "pu", "ぺ": "pe", "ぽ": "po",
+    "きゃ": "kya", "きゅ": "kyu", "きょ": "kyo",
+    "しゃ": "sha", "しゅ": "shu", "しょ": "sho",
+    "ちゃ": "cha", "ちゅ": "chu", "ちょ": "cho",
+    "にゃ": "nya", "にゅ": "nyu", "にょ": "nyo",
+    "ひゃ": "hya", "ひゅ": "hyu", "ひょ": "hyo",
+    "みゃ": "mya", "みゅ": "myu", "みょ": "myo",
+    "りゃ": "rya", "りゅ": "ryu", "りょ": "ryo",
+    "ぎゃ": "gya", "ぎゅ": "gyu", "ぎょ": "gyo",
+    "じゃ": "ja", "じゅ": "ju", "じょ": "jo",
+    "びゃ": "bya", "びゅ": "byu", "びょ": "byo",
+    "ぴゃ": "pya", "ぴゅ": "pyu", "ぴょ": "pyo",
+    "ふぁ": "fa", "ふぃ": "fi", "ふぇ": "fe", "ふぉ": "fo",
+    "てぃ": "ti", "でぃ": "di", "とぅ": "tu", "どぅ": "du",
+    "しぇ": "she", "じぇ": "je", "ちぇ": "che",
+    "うぃ": "wi", "うぇ": "we", "うぉ": "wo", "ゔ": "vu",
+}
+
+# Other ways learners type the same kana (Kunrei-shiki, Nihon-shiki, IME)
+VARIANTS = {
+    "si": "し", "ti": "ち", "tu": "つ", "hu": "ふ", "zi": "じ", "di": "ぢ", "du": "づ",
+    "sya": "しゃ", "syu": "しゅ", "syo": "しょ",
+    "tya": "ちゃ", "tyu": "ちゅ", "tyo": "ちょ",
+    "cya": "ちゃ", "cyu": "ちゅ", "cyo": "ちょ",
+    "zya": "じゃ", "zyu": "じゅ", "zyo": "じょ",
+    "jya": "じゃ", "jyu": "じゅ", "jyo": "じょ",
+    "wo": "を", "la": "ら", "li": "り", "lu": "る", "le": "れ", "lo": "ろ",
+}
+
+# Macron and circumflex long vowels, as Hepburn writes them (ō is usually おう)
+LONG_VOWELS = {"ā": "aa", "ī": "ii", "ū": "uu", "ē": "ee", "ō": "ou",
+               "â": "aa", "î": "ii", "û": "uu", "ê": "ee", "ô": "ou"}
+
+VOWELS = set("aeiou")
+SMALL_VOWELS = {"ゃ": "a", "ゅ": "u", "ょ": "o", "ぁ": "a", "ぃ": "i", "ぅ": "u", "ぇ": "e", "ぉ": "o"}
+# Kana that lengthen the vowel before them, by that vowel
+LENGTHENERS = {"a": "あ", "i": "い", "u": "う", "e": "いえ", "o": "うお"}
+
+
+def _compile(pairs):
+    """Trie of nested dicts; the kana of a complete key is stored under ""."""
+    root = {}
+    for romaji, kana in pairs:
+        node = root
+        for char in romaji:
+            node = node.setdefault(char, {})
+        node[""] = kana
+    return root
+
+
+# Hepburn first so that variants never replace a Hepburn reading ("ji" stays じ)
+TRIE = _compile([(romaji, kana) for kana, romaji in HEPBURN.items()
+                 if kana not in ("を", "ぢ", "づ", "ん")] + list(VARIANTS.items()))
+
+# Vowel each kana ends in, for folding long vowels
+VOWEL_OF = {kana[-1]: romaji[-1] for kana, romaji in HEPBURN.items()
+            if len(kana) == 1 and romaji[-1] in VOWELS}
+VOWEL_OF.update(SMALL_VOWELS)
+
+
+def katakana_to_hiragana(text):
+    """Map katakana (ァ-ヶ) to hiragana, leaving everything else"""
+    return "".join(chr(ord(c) - 0x60) if "ァ" <= c <= "ヶ" else c for c in text)
+
+
+def to_kana(text):
+    """Hiragana for a typed reading in romaji and/or kana"""
+    text = unicodedata.normalize("NFC", text.strip().lower())
+    text = "".join(LONG_VOWELS.get(c, c) for c in text if c not in " -.")
+    text = katakana_to_hiragana(text)
+
+    out = []
+    i = 0
+    n = len(text)
+    while i < n:
+        char = text[i]
+        following = text[i + 1] if i + 1 < n else ""
+        if char == "n" and following in ("'", "n"):
+            # n' and nn spell ん; in "nni" (konnichi) the second n starts に
+            out.append("ん")
+            after = text[i + 2] if i + 2 < n else ""
+            i += 1 if following == "n" and (after in VOWELS or after == "y") else 2
+            continue
+        if char == "m" and following in ("b", "p", "m"):
+            # Hepburn's shimbun, sampo
+            out.append("ん")
+            i += 1
+            continue
+        if char == following and char.isascii() and char.isalpha() and char not in VOWELS:
+            # A doubled consonant is a small tsu (kekka, zasshi)
+            out.append("っ")
+            i += 1
+            continue
+        if char == "t" and text.startswith("ch", i + 1):
+            out.append("っ")
+            i += 1
+            continue
+
+        # Longest romaji match from the trie
+        node = TRIE
+        match, length = None, 0
+        j = i
+        while j < n and text[j] in node:
+            node = node[text[j]]
+            j += 1
+            if "" in node:
+                match, length = node[""], j - i
+        if match is not None:
+            out.append(match)
+            i += length
+        elif char == "n":
+            out.append("ん")
+            i += 1
+        else:
+            # Kana, or anything the table does not know, passes through
+            out.append(char)
+            i += 1
+    return "".join(out)
+
+
+def _with_katakana(table):
+    """The table plus the same entries keyed by katakana"""
+    table = dict(table)
+    table.update({"".join(chr(ord(c) + 0x60) for c in kana): romaji
+                  for kana, romaji in table.items()})
+    return table
+
+
+# Kana -> romaji for to_romaji: two-kana combinations (きゃ, ティ) are replaced
+# through COMBINATION, then every single kana by str.translate. っ, ん and ー
+# depend on their neighbours, so they are left in place and resolved last.
+COMBINATIONS = _with_katakana({kana: romaji for kana, romaji in HEPBURN.items() if len(kana) == 2})
+COMBINATION = re.compile("[%s][%s]" % ("".join({k[0] for k in COMBINATIONS}),
+                                       "".join({k[1] for k in COMBINATIONS})))
+SINGLE_KANA = str.maketrans(_with_katakana(
+    {kana: romaji for kana, romaji in dict(HEPBURN, **SMALL_VOWELS).items()
+     if len(kana) == 1 and kana != "ん"}))
+SMALL_KANA_PRESENT = re.compile("[ぁぃぅぇぉゃゅょァィゥェォャュョ]")
+SYLLABIC_N = re.compile("[んン](?=[aeiouy])")
+SMALL_TSU = re.compile("[っッ]+([a-z])")
+SMALL_TSU_CH = re.compile("[っッ]+(?=ch)")
+LONG_MARK = re.compile("([aeiou])ー")
+
+
+def to_romaji(kana):
+    """Hepburn romaji for a kana reading, spelled the way the deck writes it:
+    long vowels as the kana has them (ou, uu; ー repeats the vowel), っ as a
+    doubled consonant (tch before ch) and ん as n, or n' before a vowel or y"""
+    if SMALL_KANA_PRESENT.search(kana):
+        kana = COMBINATION.sub(lambda m: COMBINATIONS.get(m.group(), m.group()), kana)
+    text = kana.translate(SINGLE_KANA)
+    if "ー" in text:
+        text = LONG_MARK.sub(r"\1\1", text)
+    if "ん" in text or "ン" in text:
+        text = SYLLABIC_N.sub("n'", text).replace("ん", "n").replace("ン", "n")
+    if "っ" in text or "ッ" in text:
+        text = SMALL_TSU.sub(r"\1\1", SMALL_TSU_CH.sub("t", text))
+        text = text.replace("っ", "").replace("ッ", "")
+    return text
+
+
+def fold_long_vowels(kana):
+    """Write long vowels as ー, so おう, おお and ō all compare equal"""
+    out = []
+    vowel = None
+    for char in kana:
+        if vowel is not None and (char == "ー" or char in LENGTHENERS[vowel]):
+            out.append("ー")
+            continue
+        out.append(char)
+        vowel = VOWEL_OF.get(char)
+    return "".join(out)
+
+
+def typo_limit(reading):
+    """Edits tolerated in a typed reading: none up to 4 kana, then one per 4"""
+    return max(0, (len(reading) - 1) // 4)
+
+
+# n before a vowel or y, which may be ん written without its apostrophe
+AMBIGUOUS_N = re.compile(r"n(?=[aeiouy])")
+
+
+def typed_kana(typed):
+    """Kana spellings of a typed answer: as read, then (if it differs) with
+    every n before a vowel taken as ん, since han'ei is often typed hanei"""
+    spellings = [to_kana(typed)]
+    syllabic = to_kana(AMBIGUOUS_N.sub("n'", typed.lower()))
+    if syllabic != spellings[0]:
+        spellings.append(syllabic)
+    return spellings
+
+
+def reading_distance(typed, readings):
+    """Smallest edit distance from a typed answer to any of the readings
+    (after normalizing both), or None if none is within its typo limit"""
+    answers = [fold_long_vowels(kana) for kana in typed_kana(typed)]
+    best = None
+    for reading in readings:
+        target = fold_long_vowels(katakana_to_hiragana(reading))
+        limit = typo_limit(target)
+        for answer in answers:
+            distance = bounded_edit_distance(answer, target, limit)
+            if distance <= limit and (best is None or distance < best):
+                best = distance
+                if distance == 0:
+                    return best
+    return best
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Japanese Vocabulary Store - Compiled Deck
+Compiles the japanese_vocab_partX.py files into a single binary file that is
+opened with mmap and decoded one entry at a time.
+
+File layout (little-endian):
+    header        magic, version, field count, entry count
+    field names   one (offset, length) reference per field
+    records       one fixed-width record per entry: (offset, length) per field
+    string table  UTF-8 text, each distinct string stored once
+
+The confusable-distractor neighbor lists of every answer language are built
+along with the store and saved next to it (see japanese_confusables).
+
+The romaji of each entry is not stored in the part files; it is generated
+from the kana while compiling, so it always agrees with the reading.
+"""
+
+import importlib
+import mmap
+import os
+import struct
+import sys
+from collections.abc import Sequence
+from pathlib import Path
+
+from japanese_confusables import ConfusableIndex
+from japanese_romaji import to_romaji
+
+FIELDS = ("kanji", "kana", "romaji", "english", "thai", "arabic", "russian")
+
+def derived_romaji(entry):
+    """Hepburn romaji generated from an entry's kana"""
+    return to_romaji(entry["kana"])
+
+
+# Fields generated from other fields at compile time rather than stored
+DERIVED_FIELDS = {"romaji": derived_romaji}
+
+# Fields a quiz can ask for as the answer
+ANSWER_FIELDS = ("english", "thai", "arabic", "russian")
+
+# Fields whose repeated values make two entries indistinguishable in a quiz
+COLLISION_FIELDS = ("kanji", "english", "thai", "arabic", "russian")
+
+PART_MODULES = [
+    ("japanese_vocab_part1", "VOCAB_PART1"),
+    ("japanese_vocab_part2", "VOCAB_PART2"),
+    ("japanese_vocab_part3", "VOCAB_PART3"),
+    ("japanese_vocab_part4", "VOCAB_PART4"),
+    ("japanese_vocab_part5", "VOCAB_PART5"),
+]
+
+BASE_DIR = Path(__file__).resolve().parent
+DEFAULT_STORE = BASE_DIR / "japanese_vocab.bin"
+
+MAGIC = b"JVOC"
+VERSION = 1
+HEADER = struct.Struct("<4sHHI")
+REF = struct.Struct("<IH")
+
+
+def record_struct(num_fields):
+    """Return the struct describing one fixed-width entry record"""
+    return struct.Struct("<" + "IH" * num_fields)
+
+
+def load_parts():
+    """Import the vocabulary part modules and concatenate their entries"""
+    if str(BASE_DIR) not in sys.path:
+        sys.path.insert(0, str(BASE_DIR))
+    entries = []
+    for module_name, attr in PART_MODULES:
+        entries.extend(getattr(importlib.import_module(module_name), attr))
+    return entries
+
+
+def part_files():
+    """Return the source files the default store is compiled from"""
+    return [BASE_DIR / f"{module_name}.py" for module_name, _ in PART_MODULES]
+
+
+def build_files():
+    """Return every file the default store depends on: the parts, and the
+    code that lays out the records and derives fields such as romaji"""
+    return part_files() + [BASE_DIR / "japanese_vocab_store.py", BASE_DIR / "japanese_romaji.py"]
+
+
+def compile_store(entries, path=DEFAULT_STORE, fields=FIELDS):
+    """Write entries to a binary store at path (atomically replaced)"""
+    strings = bytearray()
+    offsets = {}
+
+    def intern(text):
+        data = str(text).encode("utf-8")
+        if len(data) > 0xFFFF:
+            raise ValueError(f"String too long for store: {text[:20]!r}...")
+        if data not in offsets:
+            offsets[data] = len(strings)
+            strings.extend(data)
+        if len(strings) > 0xFFFFFFFF:
+            raise ValueError("String table exceeds 4 GiB")
+        return offsets[data], len(data)
+
+    record = record_struct(len(fields))
+    name_refs = b"".join(REF.pack(*intern(name)) for name in fields)
+    records = bytearray()
+    derive = [DERIVED_FIELDS.get(name) for name in fields]
+    for entry in entries:
+        refs = []
+        for name, generate in zip(fields, derive):
+            refs.extend(intern(generate(entry) if generate else entry[name]))
+        records.extend(record.pack(*refs))
+
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(fields), len(entries)))
+        f.write(name_refs)
+        f.write(records)
+        f.write(strings)
+    os.replace(tmp_path, path)
+    return path
+
+
+def find_collisions(entries, fields=COLLISION_FIELDS):
+    """Return {field: {value: [ids]}} for every value shared by 2+ entries.
+
+    Runs in a single pass over the entries, so it is cheap enough to call
+    on every ingest.
+    """
+    seen = {name: {} for name in fields}
+    for word_id, entry in enumerate(entries):
+        for name in fields:
+            seen[name].setdefault(entry[name], []).append(word_id)
+    return {
+        name: {value: ids for value, ids in values.items() if len(ids) > 1}
+        for name, values in seen.items()
+    }
+
+
+def print_collisions(collisions, entries, verbose=False):
+    """Print a collision report; one line per field unless verbose"""
+    for name, values in collisions.items():
+        print(f"{name}: {len(values)} values shared by more than one word")
+        if verbose:
+            for value, ids in values.items():
+                kanji = ", ".join(entries[i]["kanji"] for i in ids)
+                print(f"    {value}: {kanji}")
+
+
+def find_romaji_mismatches(entries):
+    """Return {id: (stored, generated)} for every entry that still carries a
+    romaji which differs from the one generated from its kana"""
+    mismatches = {}
+    for word_id, entry in enumerate(entries):
+        stored = entry.get("romaji")
+        if stored is not None:
+            generated = derived_romaji(entry)
+            if stored != generated:
+                mismatches[word_id] = (stored, generated)
+    return mismatches
+
+
+def print_romaji_mismatches(mismatches, entries, verbose=False):
+    """Print the romaji mismatch report; one line unless verbose"""
+    print(f"romaji: {len(mismatches)} stored values differ from the kana (generated values used)")
+    if verbose:
+        for word_id, (stored, generated) in mismatches.items():
+            entry = entries[word_id]
+            print(f"    {entry['kanji']} ({entry['kana']}): {stored} -> {generated}")
+
+
+class VocabStore(Sequence):
+    """Read-only, memory-mapped view of a compiled vocabulary store.
+
+    Indexing returns a fresh dict with the same keys as the source entries;
+    nothing is decoded until an entry (or a single field) is requested.
+    """
+
+    def __init__(self, path=DEFAULT_STORE):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, num_fields, count = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            self._mm.close()
+            raise ValueError(f"{self.path} is not a version {VERSION} vocabulary store")
+
+        self._count = count
+        self._record = record_struct(num_fields)
+        self._records_start = HEADER.size + num_fields * REF.size
+        self._strings_start = self._records_start + count * self._record.size
+
+        names = []
+        for i in range(num_fields):
+            offset, length = REF.unpack_from(self._mm, HEADER.size + i * REF.size)
+            names.append(self._text(offset, length))
+        self.fields = tuple(names)
+        self._field_pos = {name: i for i, name in enumerate(self.fields)}
+
+    def _text(self, offset, length):
+        start = self._strings_start + offset
+        return self._mm[start:start + length].decode("utf-8")
+
+    def _refs(self, index):
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("vocabulary index out of range")
+        return self._record.unpack_from(self._mm, self._records_start + index * self._record.size)
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        refs = self._refs(index)
+        return {
+            name: self._text(refs[2 * i], refs[2 * i + 1])
+            for i, name in enumerate(self.fields)
+        }
+
+    def field(self, index, name):
+        """Decode a single field of one entry"""
+        refs = self._refs(index)
+        i = self._field_pos[name]
+        return self._text(refs[2 * i], refs[2 * i + 1])
+
+    def close(self):
+        self._mm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def is_stale(path=DEFAULT_STORE):
+    """True if the store is missing or older than any file it is built from"""
+    path = Path(path)
+    if not path.exists():
+        return True
+    built = path.stat().st_mtime
+    return any(source.stat().st_mtime > built for source in build_files())
+
+
+def build_neighbor_lists(path=DEFAULT_STORE, languages=ANSWER_FIELDS):
+    """Build and save the confusable-neighbor lists of a store for every
+    answer language (any that are already up to date are kept)"""
+    vocabulary = VocabStore(path)
+    for language in languages:
+        ConfusableIndex(vocabulary, language)
+    return vocabulary
+
+
+def open_vocabulary(path=DEFAULT_STORE):
+    """Open the compiled store, rebuilding it from the part files if stale"""
+    if is_stale(path):
+        compile_store(load_parts(), path)
+        return build_neighbor_lists(path)
+    return VocabStore(path)
+
+
+def main():
+    """Compile the part files into a store"""
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Compile the Japanese vocabulary store")
+    parser.add_argument("-o", "--output", default=str(DEFAULT_STORE),
+                        help="path of the compiled store (default: %(default)s)")
+    parser.add_argument("--check", action="store_true",
+                        help="list every duplicated kanji and translation, and every "
+                             "stored romaji that differs from its kana")
+    args = parser.parse_args()
+
+    entries = load_parts()
+    path = compile_store(entries, args.output)
+    print(f"Compiled {len(entries)} words into {path} ({path.stat().st_size} bytes)")
+    start = time.perf_counter()
+    build_neighbor_lists(path).close()
+    print(f"Built confusable neighbors for {len(ANSWER_FIELDS)} languages "
+          f"in {time.perf_counter() - start:.2f}s")
+    print_collisions(find_collisions(entries), entries, verbose=args.check)
+    print_romaji_mismatches(find_romaji_mismatches(entries), entries, verbose=args.check)
+
+
+if __name__ == "__main__":
+    main()
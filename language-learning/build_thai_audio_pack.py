@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Thai Audio Pack Builder
+Pre-renders the audio of every consonant, vowel and example word into a
+single pack file that thai_alphabet.py plays from, so the quiz never needs
+to synthesize speech at runtime.
+
+Clips are synthesized in parallel across all cores. Rebuilding reuses the
+clips already in the pack and only synthesizes the ones that are new.
+
+    python3 build_thai_audio_pack.py                    # writes thai_audio.pack
+    python3 build_thai_audio_pack.py --backend espeak --force
+"""
+
+import argparse
+import time
+
+from thai_alphabet import AUDIO_PACK_PATH, CONSONANTS, VOWELS, audio_texts
+from audio_pack import build_pack
+from tts_backends import BACKENDS, DEFAULT_BACKEND, get_backend
+
+
+def pack_clips():
+    """Every (text, lang, slow) clip the quiz can play"""
+    return [(text, 'th', False) for item in CONSONANTS + VOWELS for text in audio_texts(item)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-render the Thai quiz audio into a pack")
+    parser.add_argument("-o", "--output", default=str(AUDIO_PACK_PATH),
+                        help="path of the pack (default: %(default)s)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="processes (default: all cores)")
+    parser.add_argument("--force", action="store_true",
+                        help="re-render every clip instead of reusing the existing pack "
+                             "(needed after switching backend)")
+    parser.add_argument("--backend", default=DEFAULT_BACKEND, choices=list(BACKENDS),
+                        help="TTS backend to render with (default: %(default)s)")
+    args = parser.parse_args()
+
+    backend = get_backend(args.backend)
+    if not backend.available():
+        parser.error(f"the {backend.name} TTS backend is not available on this machine")
+
+    start = time.perf_counter()
+    clips = pack_clips()
+    reused, synthesized = build_pack(clips, args.output, backend, args.workers, args.force)
+    print(f"Wrote {reused + synthesized} clips to {args.output} "
+          f"({synthesized} synthesized, {reused} reused) in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,17 +2,24 @@
 """
 Thai Alphabet Learning - Terminal Edition with Audio
 A quiz app to learn Thai consonants and vowels with native pronunciation
+
+    python3 thai_alphabet.py [--no-audio]
 """
 
+import argparse
 import random
 import os
 import sys
 import time
-import subprocess
-import tempfile
 from pathlib import Path
-from gtts import gTTS
-import pygame
+
+# Shared modules (spaced repetition, ...) live in the repository root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from spaced_repetition import Scheduler
+from progress_store import ProgressStore
+from terminal_render import Screen
+from terminal_input import read_choice, wait_for_key
+from thai_syllables import SyllableEngine
 
 # ANSI color codes for terminal formatting
 class Colors:
@@ -104,55 +111,122 @@ VOWELS = [
     {"letter": "ฤ", "romanization": "rʉ", "type": "Special", "example": "ฤดู (rʉ́-duu) - season"}
 ]
 
+# Syllables composed from the letters above, generated on demand
+SYLLABLES = SyllableEngine(CONSONANTS, VOWELS)
+
 MODES = {
     "1": ("consonants", "Consonants (44 letters)", CONSONANTS),
     "2": ("vowels", "Vowels (26 forms)", VOWELS),
-    "3": ("all", "All Characters", CONSONANTS + VOWELS)
+    "3": ("all", "All Characters", CONSONANTS + VOWELS),
+    "4": ("syllables", "Syllables and tones (generated)", None),
+    "5": ("same-sound", "Same-sound letters (drill)", None)
 }
 
 
-def play_audio(text, lang='th', slow=False):
-    """Play audio pronunciation using Google TTS and pygame"""
-    audio_file = None
-    try:
-        # Initialize pygame mixer if not already initialized
-        if not pygame.mixer.get_init():
-            pygame.mixer.init()
-
-        # Create temporary file for audio
-        with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as f:
-            audio_file = f.name
-
-        # Clean the text - ensure we're only playing what's requested
-        text = str(text).strip()
-
-        # Generate speech using gTTS
-        tts = gTTS(text=text, lang=lang, slow=slow)
-        tts.save(audio_file)
-
-        # Play the audio file using pygame
-        pygame.mixer.music.load(audio_file)
-        pygame.mixer.music.play()
+def romanization_groups(characters):
+    """Characters grouped by romanization, in table order"""
+    groups = {}
+    for c in characters:
+        groups.setdefault(c['romanization'], []).append(c)
+    return groups
 
-        # Wait for playback to finish
-        while pygame.mixer.music.get_busy():
-            pygame.time.Clock().tick(10)
 
-        return True
-
-    except Exception as e:
+# Several letters share a romanization (five are kh, six th), so wrong
+# answers are drawn from the distinct romanizations of each mode, grouped
+# once here rather than scanned for every question
+ROMANIZATION_GROUPS = romanization_groups(CONSONANTS + VOWELS)
+ROMANIZATIONS = {
+    name: list(romanization_groups(characters))
+    for name, _, characters in MODES.values() if characters is not None
+}
+# Letters only told apart by their spelling, for the same-sound drill
+SAME_SOUND_GROUPS = [group for group in ROMANIZATION_GROUPS.values() if len(group) > 1]
+
+
+# Pre-rendered clips (see build_thai_audio_pack.py) are played from the pack;
+# anything else is synthesized once by the TTS backend (LANGUAGE_TTS, see
+# tts_backends.py) and then played from the on-disk cache
+AUDIO_PACK_PATH = Path(os.environ.get("THAI_AUDIO_PACK",
+                                      Path(__file__).resolve().parent / "thai_audio.pack"))
+
+# Audio is set up by init_audio() on first use, so the audio modules, the TTS
+# engine and pygame cost nothing at startup, and nothing at all with --no-audio
+AUDIO_ENABLED = True
+AUDIO_PACK = None
+AUDIO_CACHE = None
+PREFETCH = None
+PLAYER = None
+
+# Audio for the next few questions is synthesized while the current one is
+# answered
+PREFETCH_AHEAD = 2
+
+
+def init_audio():
+    """Open the audio pack and cache and get a player, once"""
+    global AUDIO_PACK, AUDIO_CACHE, PREFETCH, PLAYER
+    if PLAYER is not None:
+        return
+    from audio_cache import AudioCache, AudioPrefetcher, backend_dir
+    from audio_pack import open_pack
+    from audio_daemon import audio_player
+    from tts_backends import get_backend
+
+    AUDIO_PACK = open_pack(AUDIO_PACK_PATH)
+    tts = get_backend()
+    AUDIO_CACHE = AudioCache(tts, backend_dir(tts.name))
+    PREFETCH = AudioPrefetcher(AUDIO_CACHE)
+    # Decoded clips are kept in memory, so replays start instantly; when the
+    # audio daemon (audio_daemon.py) is running it plays them instead. pygame
+    # itself is imported by the player thread on the first clip.
+    PLAYER = audio_player(load_clip)
+
+
+def close_audio():
+    """Stop playback and background synthesis, if audio was ever used"""
+    if PLAYER is not None:
+        PLAYER.close()
+        PREFETCH.close()
+
+
+def load_clip(text, lang='th', slow=False):
+    """Audio bytes for text, from the pack if it has them"""
+    if AUDIO_PACK is not None:
+        data = AUDIO_PACK.get(text, lang, slow)
+        if data is not None:
+            return data
+    return AUDIO_CACHE.read(text, lang, slow)
+
+
+def play_audio(text, lang='th', slow=False, queue=False):
+    """Play audio pronunciation using the TTS backend and pygame.
+
+    Returns at once: the clip plays in the background and cuts off the one
+    playing, or with queue=True waits for it.
+    """
+    global AUDIO_ENABLED
+    if not AUDIO_ENABLED:
+        return
+    init_audio()
+
+    # Report a clip that failed in the background since the last call
+    error = PLAYER.take_error()
+    if isinstance(error, ImportError):
+        # pygame or the TTS engine is not installed: carry on without sound
+        print(f"{Colors.WARNING}Audio disabled: {error} "
+              f"(pip install pygame gTTS, or run with --no-audio){Colors.ENDC}")
+        AUDIO_ENABLED = False
+        return
+    if error is not None:
         # Print error for debugging but don't crash
-        print(f"{Colors.WARNING}Audio playback failed: {e}{Colors.ENDC}")
-        return False
+        print(f"{Colors.WARNING}Audio playback failed: {error}{Colors.ENDC}")
 
-    finally:
-        # Clean up the temporary file
-        if audio_file and os.path.exists(audio_file):
-            try:
-                pygame.mixer.music.unload()
-                os.unlink(audio_file)
-            except:
-                pass
+    # Clean the text - ensure we're only playing what's requested
+    text = str(text).strip()
+
+    # Packed or cached clip (synthesized the first time it is needed),
+    # decoded once and played from memory
+    PLAYER.play(text, lang, slow, queue)
 
 
 def extract_thai_word(example_text):
@@ -161,18 +235,80 @@ def extract_thai_word(example_text):
     return example_text.split()[0] if example_text else ""
 
 
+def audio_texts(item):
+    """Every text the quiz speaks for one character"""
+    return [item['letter'], extract_thai_word(item['example'])]
+
+
+def prefetch_audio(item):
+    """Queue the letter and example-word audio of an upcoming question"""
+    if not AUDIO_ENABLED:
+        return
+    init_audio()
+    for text in audio_texts(item):
+        if AUDIO_PACK is None or (text, 'th', False) not in AUDIO_PACK:
+            PREFETCH.submit(text)
+
+
+# Feedback is drawn inside the frame, so only the answer prompt needs rows
+# below it: frames are at most 18 lines and fit a 24-row terminal
+SCREEN = Screen(reserve=6)
+
+
 def clear_screen():
     """Clear the terminal screen"""
-    os.system('clear' if os.name != 'nt' else 'cls')
+    SCREEN.clear()
+
+
+def header_lines():
+    """Lines of the application header"""
+    return [
+        f"{Colors.HEADER}{Colors.BOLD}{'=' * 60}{Colors.ENDC}",
+        f"{Colors.HEADER}{Colors.BOLD}    🇹🇭  THAI ALPHABET QUIZ  🇹🇭{Colors.ENDC}",
+        f"{Colors.HEADER}{Colors.BOLD}{'=' * 60}{Colors.ENDC}",
+    ]
 
 
 def print_header():
     """Print the application header"""
-    print(f"{Colors.HEADER}{Colors.BOLD}")
-    print("=" * 60)
-    print("    🇹🇭  THAI ALPHABET QUIZ  🇹🇭")
-    print("=" * 60)
-    print(f"{Colors.ENDC}")
+    for line in [""] + header_lines() + [""]:
+        print(line)
+
+
+def result_lines(is_correct, correct_answer):
+    """Feedback on an answer, shown in place of the choices"""
+    if is_correct:
+        return [f"{Colors.OKGREEN}{Colors.BOLD}✓ Correct!{Colors.ENDC}"]
+    return [
+        f"{Colors.FAIL}{Colors.BOLD}✗ Incorrect{Colors.ENDC}",
+        f"{Colors.OKGREEN}The correct answer was: {correct_answer}{Colors.ENDC}",
+    ]
+
+
+def syllable_items(count):
+    """Quiz items for count random syllables, with the same sounds in the
+    other tones as the wrong answers"""
+    items = {}
+    for syllable in SYLLABLES.random_syllables():
+        if len(items) == count:
+            break
+        items[syllable.thai] = {
+            "letter": syllable.thai,
+            "romanization": syllable.romanization,
+            "class": SYLLABLES.initials[syllable.initial][0],
+            "example": f"{syllable.thai} ({syllable.romanization}) - {syllable.tone} tone, "
+                       f"{'live' if syllable.live else 'dead'} syllable",
+            "distractors": SYLLABLES.tone_variants(syllable),
+        }
+    return list(items.values())
+
+
+def masked_example(item):
+    """The example with the item's letter blanked out of the Thai word"""
+    # Vowel forms are written around an อ placeholder
+    letters = set(item['letter'] if 'class' in item else item['letter'].replace('อ', ''))
+    word, _, rest = item['example'].partition(" ")
+    return "".join("_" if ch in letters else ch for ch in word) + " " + rest
 
 
 def select_mode():
@@ -182,109 +318,125 @@ def select_mode():
         print(f"  {key}. {name}")
 
     while True:
-        choice = input(f"\n{Colors.BOLD}Enter your choice (1-3): {Colors.ENDC}").strip()
+        choice = input(f"\n{Colors.BOLD}Enter your choice (1-{len(MODES)}): {Colors.ENDC}").strip()
         if choice in MODES:
-            return MODES[choice][2]
-        print(f"{Colors.FAIL}Invalid choice. Please select 1-3.{Colors.ENDC}")
+            return MODES[choice][0], MODES[choice][2]
+        print(f"{Colors.FAIL}Invalid choice. Please select 1-{len(MODES)}.{Colors.ENDC}")
 
 
-def run_quiz(characters, num_questions=10):
+def run_quiz(characters, num_questions=10, scheduler=None, progress=None, mode=None):
     """Run a multiple choice quiz with audio"""
-    quiz_items = random.sample(characters, min(num_questions, len(characters)))
+    if progress is not None:
+        session_id = progress.start_session("thai", mode)
+    if scheduler is not None:
+        by_letter = {c['letter']: c for c in characters}
+        quiz_items = [by_letter[letter] for letter in scheduler.next_cards(num_questions)]
+    else:
+        quiz_items = random.sample(characters, min(num_questions, len(characters)))
     score = 0
     total = len(quiz_items)
+    # Distinct answers the wrong choices are drawn from
+    romanizations = ROMANIZATIONS.get(mode) or list(romanization_groups(characters))
 
-    for i, item in enumerate(quiz_items, 1):
-        clear_screen()
-        print_header()
-        print(f"\n{Colors.BOLD}Quiz Progress: {i}/{total}  |  Score: {score}{Colors.ENDC}")
-        print("─" * 60)
-
-        # Show the Thai character
-        print(f"\n{Colors.HEADER}{Colors.BOLD}")
-        print("        " + item['letter'])
-        print(f"{Colors.ENDC}")
-        print("─" * 60)
+    for item in quiz_items[:PREFETCH_AHEAD]:
+        prefetch_audio(item)
 
-        # Play audio pronunciation
-        print(f"\n{Colors.WARNING}🔊 Playing audio...{Colors.ENDC}")
-        play_audio(item['letter'])
-        time.sleep(0.5)
+    for i, item in enumerate(quiz_items, 1):
+        # Warm the audio of the question PREFETCH_AHEAD places ahead
+        if i - 1 + PREFETCH_AHEAD < total:
+            prefetch_audio(quiz_items[i - 1 + PREFETCH_AHEAD])
 
         # Generate choices
         correct_answer = item['romanization']
-        wrong_answers = [
-            c['romanization'] for c in characters
-            if c['letter'] != item['letter']
-        ]
-
-        random.shuffle(wrong_answers)
+        if 'distractors' in item:
+            wrong_answers = list(item['distractors'])
+            random.shuffle(wrong_answers)
+        else:
+            # One extra in case the correct answer is drawn
+            wrong_answers = [r for r in random.sample(romanizations, 4) if r != correct_answer]
         choices = [correct_answer] + wrong_answers[:3]
         random.shuffle(choices)
 
-        # Display choices
-        print(f"\n{Colors.BOLD}What is the romanization?{Colors.ENDC}\n")
-        for j, choice in enumerate(choices, 1):
-            print(f"  {j}. {choice}")
+        # Show the Thai character and the choices in one frame
+        top = header_lines() + [
+            "",
+            f"{Colors.BOLD}Quiz Progress: {i}/{total}  |  Score: {score}{Colors.ENDC}",
+            "─" * 60,
+            "",
+            f"{Colors.HEADER}{Colors.BOLD}        {item['letter']}{Colors.ENDC}",
+            "",
+            "─" * 60,
+        ]
+        frame = top + [
+            f"{Colors.WARNING}🔊 Playing audio...{Colors.ENDC}" if AUDIO_ENABLED else "",
+            f"{Colors.BOLD}What is the romanization?{Colors.ENDC}",
+        ] + [f"  {j}. {choice}" for j, choice in enumerate(choices, 1)] + [
+            "",
+            f"{Colors.OKCYAN}[r] Replay audio  |  [1-4] Answer{Colors.ENDC}" if AUDIO_ENABLED
+            else f"{Colors.OKCYAN}[1-4] Answer{Colors.ENDC}",
+        ]
+        SCREEN.render(frame)
+        # Reaction time counts from the moment the letter is on screen
+        shown_ns = time.perf_counter_ns()
 
-        print(f"\n{Colors.OKCYAN}[r] Replay audio  |  [1-4] Answer{Colors.ENDC}")
+        # Play audio pronunciation
+        play_audio(item['letter'])
 
-        # Get answer
+        # Get answer; the audio plays in the background, so answering
+        # does not have to wait for it
         while True:
-            try:
-                answer = input(f"\n{Colors.BOLD}Your choice: {Colors.ENDC}").strip().lower()
-
-                if answer == 'r':
-                    print(f"{Colors.WARNING}🔊 Playing audio...{Colors.ENDC}")
-                    play_audio(item['letter'])
-                    continue
-
-                answer_num = int(answer)
-                if 1 <= answer_num <= 4:
-                    break
-                print(f"{Colors.FAIL}Please enter a number between 1 and 4.{Colors.ENDC}")
-            except ValueError:
-                print(f"{Colors.FAIL}Please enter a valid number or 'r' to replay.{Colors.ENDC}")
+            answer, latency_ns = read_choice(
+                f"\n{Colors.BOLD}Your choice: {Colors.ENDC}", "1234r" if AUDIO_ENABLED else "1234",
+                f"{Colors.FAIL}Please enter a number between 1 and 4 or 'r' to replay.{Colors.ENDC}",
+                start_ns=shown_ns, flush=False)
+            if answer != 'r':
+                break
+            # Redrawing the frame clears the old prompt from under it
+            SCREEN.render(frame)
+            play_audio(item['letter'])
 
         # Check answer
-        user_choice = choices[answer_num - 1]
+        user_choice = choices[int(answer) - 1]
         is_correct = user_choice == correct_answer
-
-        print()
         if is_correct:
-            print(f"{Colors.OKGREEN}{Colors.BOLD}✓ Correct!{Colors.ENDC}")
             score += 1
-        else:
-            print(f"{Colors.FAIL}{Colors.BOLD}✗ Incorrect{Colors.ENDC}")
-            print(f"{Colors.OKGREEN}The correct answer was: {correct_answer}{Colors.ENDC}")
 
-        # Show additional info
-        print(f"\n{Colors.BOLD}🔊 Letter pronunciation:{Colors.ENDC}")
-        play_audio(item['letter'])
+        if scheduler is not None:
+            state = scheduler.review(item['letter'], is_correct)
+            if progress is not None:
+                progress.record_review(session_id, "thai", mode, state, is_correct,
+                                       latency_ms=latency_ns / 1e6)
 
+        # Show the result and additional info in place of the choices
+        feedback = [""] + result_lines(is_correct, correct_answer)
         if 'class' in item:
-            print(f"\n{Colors.OKBLUE}Class: {item['class']} consonant{Colors.ENDC}")
+            feedback += ["", f"{Colors.OKBLUE}Class: {item['class']} consonant{Colors.ENDC}"]
         elif 'type' in item:
-            print(f"\n{Colors.OKBLUE}Type: {item['type']}{Colors.ENDC}")
+            feedback += ["", f"{Colors.OKBLUE}Type: {item['type']}{Colors.ENDC}"]
+        feedback += ["", f"{Colors.OKCYAN}Example: {item['example']}{Colors.ENDC}"]
+        if AUDIO_ENABLED:
+            feedback.append(f"{Colors.BOLD}🔊 Letter, then example word pronunciation{Colors.ENDC}")
+        SCREEN.render(top + feedback)
 
-        # Show example and play its audio
-        example_word = extract_thai_word(item['example'])
-        print(f"\n{Colors.OKCYAN}Example: {item['example']}{Colors.ENDC}")
-        print(f"{Colors.BOLD}🔊 Example word pronunciation:{Colors.ENDC}")
-        play_audio(example_word)
+        # Play the letter, then its example word
+        if AUDIO_ENABLED:
+            play_audio(item['letter'])
+            play_audio(extract_thai_word(item['example']), queue=True)
 
-        time.sleep(1)
-        input(f"\n{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
+        wait_for_key(f"\n{Colors.WARNING}Press any key to continue...{Colors.ENDC}",
+                     f"\n{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
 
-    # Show final score
-    clear_screen()
-    print_header()
+    if progress is not None:
+        progress.end_session(session_id, score, total)
+    if PREFETCH is not None:
+        PREFETCH.cancel()
+
+    show_score(score, total)
 
-    percentage = (score / total) * 100
 
-    print(f"\n{Colors.BOLD}{Colors.HEADER}{'=' * 60}{Colors.ENDC}")
-    print(f"{Colors.BOLD}{Colors.HEADER}                    QUIZ COMPLETE!{Colors.ENDC}")
-    print(f"{Colors.BOLD}{Colors.HEADER}{'=' * 60}{Colors.ENDC}\n")
+def show_score(score, total):
+    """Show the final score of a quiz"""
+    percentage = (score / total) * 100
 
     if percentage == 100:
         message = "Perfect! 🌟"
@@ -299,29 +451,114 @@ def run_quiz(characters, num_questions=10):
         message = "Keep practicing! 💪"
         color = Colors.WARNING
 
-    print(f"{color}{Colors.BOLD}{message}{Colors.ENDC}\n")
-    print(f"{Colors.BOLD}You scored {score} out of {total} ({percentage:.0f}%){Colors.ENDC}\n")
-    print("─" * 60)
+    SCREEN.render(header_lines() + [
+        "",
+        f"{Colors.BOLD}{Colors.HEADER}{'=' * 60}{Colors.ENDC}",
+        f"{Colors.BOLD}{Colors.HEADER}                    QUIZ COMPLETE!{Colors.ENDC}",
+        f"{Colors.BOLD}{Colors.HEADER}{'=' * 60}{Colors.ENDC}",
+        "",
+        f"{color}{Colors.BOLD}{message}{Colors.ENDC}",
+        "",
+        f"{Colors.BOLD}You scored {score} out of {total} ({percentage:.0f}%){Colors.ENDC}",
+        "",
+        "─" * 60,
+    ])
 
     input(f"\n{Colors.OKCYAN}Press Enter to continue...{Colors.ENDC}")
 
 
-def main():
+def run_sound_drill(num_questions=10, progress=None):
+    """Tell apart letters that sound the same from their class and an example.
+
+    The choices show the letters alone, so the class has to be known rather
+    than matched against the prompt.
+    """
+    if progress is not None:
+        session_id = progress.start_session("thai", "same-sound")
+    score = 0
+
+    for i in range(1, num_questions + 1):
+        group = random.choice(SAME_SOUND_GROUPS)
+        item = random.choice(group)
+        others = [c for c in group if c is not item]
+        choices = [item] + random.sample(others, min(3, len(others)))
+        random.shuffle(choices)
+        keys = "".join(str(j) for j in range(1, len(choices) + 1))
+        kind = (f"{item['class']} consonant" if 'class' in item else item['type'])
+
+        top = header_lines() + [
+            "",
+            f"{Colors.BOLD}Same-sound Drill: {i}/{num_questions}  |  Score: {score}{Colors.ENDC}",
+            "─" * 60,
+            f"{Colors.HEADER}{Colors.BOLD}        {item['romanization']}  ·  {kind}{Colors.ENDC}",
+            f"{Colors.OKCYAN}        {masked_example(item)}{Colors.ENDC}",
+            "─" * 60,
+        ]
+        SCREEN.render(top + [
+            f"{Colors.BOLD}Which letter is it?{Colors.ENDC}",
+        ] + [f"  {j}. {c['letter']}" for j, c in enumerate(choices, 1)] + [
+            "",
+            f"{Colors.OKCYAN}[1-{len(choices)}] Answer{Colors.ENDC}",
+        ])
+        play_audio(extract_thai_word(item['example']))
+
+        answer, _ = read_choice(
+            f"\n{Colors.BOLD}Your choice: {Colors.ENDC}", keys,
+            f"{Colors.FAIL}Please enter a number between 1 and {len(choices)}.{Colors.ENDC}")
+        is_correct = choices[int(answer) - 1] is item
+        if is_correct:
+            score += 1
+
+        SCREEN.render(top + [""] + result_lines(is_correct, f"{item['letter']} ({kind})") + [
+            "",
+            f"{Colors.OKCYAN}Example: {item['example']}{Colors.ENDC}",
+        ])
+
+        wait_for_key(f"\n{Colors.WARNING}Press any key to continue...{Colors.ENDC}",
+                     f"\n{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
+
+    if progress is not None:
+        progress.end_session(session_id, score, num_questions)
+    show_score(score, num_questions)
+
+
+def main(progress):
     """Main application loop"""
+    # One review schedule per study mode, restored from saved progress
+    schedulers = {}
+
     while True:
         clear_screen()
         print_header()
 
-        characters = select_mode()
+        mode, characters = select_mode()
 
         clear_screen()
         print_header()
-        print(f"\n{Colors.OKCYAN}Starting quiz with {len(characters)} characters...{Colors.ENDC}")
-        print(f"{Colors.WARNING}🔊 Audio will play for each character{Colors.ENDC}")
+        if mode == "same-sound":
+            print(f"\n{Colors.OKCYAN}Starting drill on {len(SAME_SOUND_GROUPS)} groups of "
+                  f"same-sound letters...{Colors.ENDC}")
+        elif characters is None:
+            # Too many syllables to schedule: each quiz draws fresh ones
+            characters = syllable_items(10)
+            print(f"\n{Colors.OKCYAN}Starting quiz with {len(characters)} generated syllables...{Colors.ENDC}")
+        else:
+            print(f"\n{Colors.OKCYAN}Starting quiz with {len(characters)} characters...{Colors.ENDC}")
+        if AUDIO_ENABLED:
+            print(f"{Colors.WARNING}🔊 Audio will play for each character{Colors.ENDC}")
         input(f"{Colors.OKCYAN}Press Enter to begin!{Colors.ENDC}")
 
-        num_questions = min(10, len(characters))
-        run_quiz(characters, num_questions)
+        if mode == "same-sound":
+            run_sound_drill(10, progress)
+        elif mode == "syllables":
+            num_questions = len(characters)
+            run_quiz(characters, num_questions, None, progress, mode)
+        else:
+            if mode not in schedulers:
+                states = progress.load_states("thai", mode)
+                schedulers[mode] = Scheduler([c['letter'] for c in characters], states)
+            num_questions = min(10, len(characters))
+            run_quiz(characters, num_questions, schedulers[mode], progress, mode)
 
         # Ask if user wants to play again
         print()
@@ -332,8 +569,17 @@ def main():
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Learn the Thai alphabet")
+    parser.add_argument("--no-audio", action="store_true",
+                        help="practice silently; skips loading pygame and the TTS engine")
+    AUDIO_ENABLED = not parser.parse_args().no_audio
+
+    progress = ProgressStore()
     try:
-        main()
+        main(progress)
     except KeyboardInterrupt:
         print(f"\n\n{Colors.WARNING}Quiz interrupted. See you next time!{Colors.ENDC}\n")
         sys.exit(0)
+    finally:
+        close_audio()
+        progress.close()
@@ -0,0 +1,215 @@
+"""
+Thai Syllables - composition engine
+Builds written syllables from an initial consonant, a vowel, a tone mark and
+an optional final consonant, and works out their tone and romanization with
+the standard rules: the tone follows from the consonant class (the `class`
+field of CONSONANTS), whether the syllable is live or dead (vowel length
+from VOWELS, and the final's sound), and the tone mark.
+
+The combinations are never stored: syllables() walks them with a generator
+and random_syllables() samples them one at a time, so a drill can draw from
+the whole space in constant memory. Only the small per-letter rule tables
+are built up front, and tone and spelling lookups are memoized.
+"""
+
+import itertools
+import random
+import unicodedata
+from collections import namedtuple
+from functools import lru_cache
+
+Syllable = namedtuple("Syllable", "thai romanization tone live initial vowel mark final")
+
+TONES = ("mid", "low", "falling", "high", "rising")
+
+# Tone marks: mai ek, mai tho, mai tri, mai chattawa
+MAI_EK, MAI_THO, MAI_TRI, MAI_CHATTAWA = "่", "้", "๊", "๋"
+TONE_MARKS = ("", MAI_EK, MAI_THO, MAI_TRI, MAI_CHATTAWA)
+MAI_TAIKHU = "็"
+
+# Combining tone diacritics used in the romanization (mid is unmarked)
+TONE_DIACRITICS = {"mid": "", "low": "̀", "falling": "̂",
+                   "high": "́", "rising": "̌"}
+
+# Sound of each consonant in final position; letters missing here never
+# close a syllable
+FINAL_SOUNDS = {}
+for _sound, _letters in (("k", "กขคฆ"), ("t", "จชซฎฏฐฑฒดตถทธศษส"), ("p", "บปพฟภ"),
+                         ("n", "ญณนรลฬ"), ("m", "ม"), ("ng", "ง"), ("w", "ว"), ("y", "ย")):
+    for _letter in _letters:
+        FINAL_SOUNDS[_letter] = _sound
+SONORANT_FINALS = {"m", "n", "ng", "w", "y"}
+
+# Written form of each vowel, open and closed by a final: C is the initial,
+# T the tone mark and F the final. None means the vowel takes no final.
+VOWEL_SPELLINGS = {
+    "อะ": ("CTะ", "CัTF"),
+    "อา": ("CTา", "CTาF"),
+    "อิ": ("CิT", "CิTF"),
+    "อี": ("CีT", "CีTF"),
+    "อึ": ("CึT", "CึTF"),
+    "อื": ("CืTอ", "CืTF"),
+    "อุ": ("CุT", "CุTF"),
+    "อู": ("CูT", "CูTF"),
+    "เอะ": ("เCTะ", "เC็TF"),
+    "เอ": ("เCT", "เCTF"),
+    "แอะ": ("แCTะ", "แC็TF"),
+    "แอ": ("แCT", "แCTF"),
+    "โอะ": ("โCTะ", "CTF"),
+    "โอ": ("โCT", "โCTF"),
+    "เอาะ": ("เCTาะ", "C็TอF"),
+    "ออ": ("CTอ", "CTอF"),
+    "เออะ": ("เCTอะ", None),
+    "เออ": ("เCTอ", "เCิTF"),
+    "เอีย": ("เCีTย", "เCีTยF"),
+    "เอือ": ("เCืTอ", "เCืTอF"),
+    "อัว": ("CัTว", "CTวF"),
+    "ไอ": ("ไCT", None),
+    "ใอ": ("ใCT", None),
+    "เอา": ("เCTา", None),
+    "อำ": ("CTำ", None),
+}
+# Spellings that do not follow the closed pattern
+CLOSED_EXCEPTIONS = {("เออ", "ย"): "เCTย"}
+# Vowels that cannot be closed by the glide they already end in
+INCOMPATIBLE_FINALS = {"อิ": "ย", "อี": "ย", "อุ": "ว", "อู": "ว", "เอีย": "ย", "อัว": "ว"}
+
+# Length of the vowels VOWELS lists as diphthongs or specials; the glide or
+# nasal ending ai, ao and am keeps them live although they are short
+VOWEL_LENGTHS = {"ia": "long", "ʉa": "long", "ua": "long",
+                 "ai": "short", "ao": "short", "am": "short"}
+LIVE_VOWELS = {"ai", "ao", "am"}
+
+# อ as an initial only carries the vowel
+SILENT_INITIALS = {"อ"}
+
+
+@lru_cache(maxsize=None)
+def tone_of(consonant_class, live, long_vowel, mark):
+    """Tone of a syllable from its initial's class, live/dead, vowel length
+    and tone mark (None if the mark cannot go on that class)"""
+    if mark == MAI_EK:
+        return "falling" if consonant_class == "Low" else "low"
+    if mark == MAI_THO:
+        return "high" if consonant_class == "Low" else "falling"
+    if mark in (MAI_TRI, MAI_CHATTAWA):
+        # Only written on mid-class consonants
+        if consonant_class != "Mid":
+            return None
+        return "high" if mark == MAI_TRI else "rising"
+    if live:
+        return "rising" if consonant_class == "High" else "mid"
+    if consonant_class == "Low":
+        return "falling" if long_vowel else "high"
+    return "low"
+
+
+@lru_cache(maxsize=None)
+def spelling(vowel, final, marked):
+    """Written pattern of a vowel closed by final (or open if final is ""),
+    or None if the vowel cannot take that final"""
+    open_form, closed_form = VOWEL_SPELLINGS[vowel]
+    if final:
+        if INCOMPATIBLE_FINALS.get(vowel) == final:
+            return None
+        form = CLOSED_EXCEPTIONS.get((vowel, final), closed_form)
+        if form is None:
+            return None
+    else:
+        form = open_form
+    if marked:
+        # A tone mark replaces mai taikhu, the short-vowel sign
+        form = form.replace(MAI_TAIKHU, "")
+    return form.replace("F", final)
+
+
+def spell(vowel, initial, mark, final):
+    """Written syllable, or None if the vowel cannot be closed by final"""
+    form = spelling(vowel, final, bool(mark))
+    if form is None:
+        return None
+    return form.replace("C", initial).replace("T", mark)
+
+
+def romanize(initial_sound, vowel_sound, final_sound, tone):
+    """Romanization with the tone as a diacritic on the first vowel letter"""
+    text = initial_sound + vowel_sound[0] + TONE_DIACRITICS[tone] + vowel_sound[1:] + final_sound
+    return unicodedata.normalize("NFC", text)
+
+
+class SyllableEngine:
+    """Composes syllables from the letter tables of thai_alphabet"""
+
+    def __init__(self, consonants, vowels, include_obsolete=False):
+        # Per-letter rule tables: initial -> (class, sound); vowel -> (sound,
+        # long, live when open); final -> sound
+        self.initials = {}
+        for c in consonants:
+            consonant_class = c["class"]
+            if consonant_class.endswith("*") and not include_obsolete:
+                continue
+            sound = "" if c["letter"] in SILENT_INITIALS else c["romanization"].split()[0]
+            self.initials[c["letter"]] = (consonant_class.rstrip("*"), sound)
+
+        self.vowels = {}
+        for v in vowels:
+            if v["letter"] not in VOWEL_SPELLINGS:
+                continue
+            sound = v["romanization"].split()[0]
+            if v["type"] == "Long vowel":
+                length = "long"
+            elif v["type"] == "Short vowel":
+                length = "short"
+            else:
+                length = VOWEL_LENGTHS[sound]
+            long_vowel = length == "long"
+            self.vowels[v["letter"]] = (sound, long_vowel, long_vowel or sound in LIVE_VOWELS)
+
+        self.finals = dict(FINAL_SOUNDS)
+        self._initial_list = list(self.initials)
+        self._vowel_list = list(self.vowels)
+        self._final_list = [""] + list(self.finals)
+
+    def compose(self, initial, vowel, mark="", final=""):
+        """The Syllable, or None if the combination cannot be written"""
+        consonant_class, initial_sound = self.initials[initial]
+        vowel_sound, long_vowel, live = self.vowels[vowel]
+        final_sound = self.finals[final] if final else ""
+        if final:
+            live = final_sound in SONORANT_FINALS
+
+        tone = tone_of(consonant_class, live, long_vowel, mark)
+        if tone is None:
+            return None
+        thai = spell(vowel, initial, mark, final)
+        if thai is None:
+            return None
+        return Syllable(thai, romanize(initial_sound, vowel_sound, final_sound, tone),
+                        tone, live, initial, vowel, mark, final)
+
+    def syllables(self):
+        """Every writable syllable, generated one at a time"""
+        for initial, vowel, mark, final in itertools.product(
+                self._initial_list, self._vowel_list, TONE_MARKS, self._final_list):
+            syllable = self.compose(initial, vowel, mark, final)
+            if syllable is not None:
+                yield syllable
+
+    def __len__(self):
+        return sum(1 for _ in self.syllables())
+
+    def random_syllables(self, rng=random):
+        """Endless stream of syllables drawn uniformly at random"""
+        while True:
+            syllable = self.compose(rng.choice(self._initial_list), rng.choice(self._vowel_list),
+                                    rng.choice(TONE_MARKS), rng.choice(self._final_list))
+            if syllable is not None:
+                yield syllable
+
+    def tone_variants(self, syllable):
+        """Romanization of the syllable's sounds in every other tone"""
+        _, initial_sound = self.initials[syllable.initial]
+        vowel_sound = self.vowels[syllable.vowel][0]
+        final_sound = self.finals[syllable.final] if syllable.final else ""
+        return [romanize(initial_sound, vowel_sound, final_sound, tone)
+                for tone in TONES if tone != syllable.tone]
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Learner Simulation - NumPy
+Simulates large populations of learners studying the Japanese VOCABULARY, to
+tune quiz length, distractor strategy and review intervals.
+
+Nothing here re-implements the quiz: cards are picked with
+spaced_repetition.next_cards_batch and rescheduled with sm2_schedule (the
+array forms of Scheduler), and the chance of guessing right is measured by
+answering real QuizSession questions at random.
+
+Requires numpy (pip install numpy); the quizzes themselves do not.
+
+    python3 learner_simulation.py --learners 100000 --days 90
+"""
+
+import argparse
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from japanese_flashcards import DISTRACTOR_MODES, LANGUAGES, VOCABULARY, QuizSession
+from spaced_repetition import (DAY, QUALITY_CORRECT, QUALITY_WRONG, START_EASE,
+                               next_cards_batch, sm2_schedule)
+
+# Memory model: recall probability is exp(-days since last review / stability)
+BASE_STABILITY = 1.0
+GROWTH = 1.5
+LAPSE_FACTOR = 0.3
+
+RETENTION_SAMPLE = 512
+
+
+def measure_guess_rate(target_language, distractors, questions=2000, seed=0):
+    """Fraction of real quiz questions answered right by picking at random"""
+    rng = random.Random(seed)
+    correct = total = 0
+    while total < questions:
+        session = QuizSession(target_language, 10, distractors, rng)
+        while (question := session.next_question()) is not None:
+            correct += session.submit_answer(rng.randrange(len(question.choices))).is_correct
+        total += session.total
+    return correct / total
+
+
+def word_difficulty():
+    """Relative difficulty per word: longer readings are harder to retain"""
+    lengths = np.array([len(VOCABULARY.field(i, "kana")) for i in range(len(VOCABULARY))],
+                       dtype=np.float32)
+    return np.clip(1 + 0.15 * (lengths - lengths.mean()), 0.5, 2.0)
+
+
+def simulate_chunk(learners, days, session_length, sessions_per_day, guess_rate,
+                   interval_scale, difficulty, seed):
+    """Simulate one block of learners.
+
+    Returns (retention per day summed over the sampled learners, number of
+    sampled learners, accuracy per learner).
+    """
+    rng = np.random.default_rng(seed)
+    words = difficulty.shape[0]
+    shape = (learners, words)
+    rows = np.arange(learners)[:, None]
+    sample = min(learners, RETENTION_SAMPLE)
+
+    ability = rng.lognormal(0.0, 0.3, size=(learners, 1)).astype(np.float32)
+
+    # Column j of every per-card array is the j-th word that learner meets,
+    # so seen words fill a prefix and selection only scans the columns in use
+    met_order = np.broadcast_to(np.arange(words), shape)
+    difficulty = difficulty[rng.permuted(met_order, axis=1)]
+    new_next = np.zeros(learners, dtype=np.int64)
+
+    # due doubles as the selection key: +inf until a card is first shown
+    due = np.full(shape, np.inf, dtype=np.float32)
+    ease = np.full(shape, START_EASE, dtype=np.float32)
+    interval = np.zeros(shape, dtype=np.float32)
+    repetitions = np.zeros(shape, dtype=np.int16)
+    lapses = np.zeros(shape, dtype=np.int16)
+    last = np.zeros(shape, dtype=np.float32)
+    stability = np.ones(shape, dtype=np.float32)
+
+    answered = np.zeros(learners, dtype=np.int64)
+    correct_total = np.zeros(learners, dtype=np.int64)
+    retention = np.zeros(days, dtype=np.float64)
+
+    for day in range(days):
+        for session in range(sessions_per_day):
+            now = day * DAY + session * (DAY / sessions_per_day)
+            active = min(words, int(new_next.max()) + session_length)
+            cards = next_cards_batch(due[:, :active], met_order[:, :active], new_next,
+                                     session_length, now)
+
+            was_seen = np.isfinite(due[rows, cards])
+            elapsed = (now - last[rows, cards]) / DAY
+            p_recall = np.where(was_seen, np.exp(-elapsed / stability[rows, cards]), 0.0)
+            recalled = rng.random(p_recall.shape) < p_recall
+            correct = recalled | (rng.random(p_recall.shape) < guess_rate)
+
+            quality = np.where(correct, QUALITY_CORRECT, QUALITY_WRONG)
+            new_ease, new_interval, new_reps, new_lapses = sm2_schedule(
+                ease[rows, cards], interval[rows, cards], repetitions[rows, cards],
+                lapses[rows, cards], quality, choose=np.where)
+            ease[rows, cards] = new_ease
+            interval[rows, cards] = new_interval
+            repetitions[rows, cards] = new_reps
+            lapses[rows, cards] = new_lapses
+            due[rows, cards] = now + new_interval * interval_scale
+
+            # Every question ends with the answer on screen, so each one counts
+            # as an exposure: first sight sets a base stability, recall grows it
+            gain = ability / difficulty[rows, cards]
+            first = BASE_STABILITY * gain
+            current = stability[rows, cards]
+            stability[rows, cards] = np.where(
+                was_seen,
+                np.where(recalled, current * (1 + GROWTH * gain),
+                         np.maximum(first, current * LAPSE_FACTOR)),
+                first)
+            last[rows, cards] = now
+
+            answered += cards.shape[1]
+            correct_total += correct.sum(axis=1)
+
+        # Retention at the end of the day over every word seen so far,
+        # measured on a fixed sample of learners to keep each day cheap
+        seen = np.isfinite(due[:sample])
+        p_now = np.exp(-((day + 1) * DAY - last[:sample]) / DAY / stability[:sample])
+        per_learner = np.where(seen, p_now, 0.0).sum(axis=1) / np.maximum(seen.sum(axis=1), 1)
+        retention[day] = per_learner.sum()
+
+    return retention, sample, correct_total / np.maximum(answered, 1)
+
+
+def simulate(learners=100_000, days=90, session_length=10, sessions_per_day=1,
+             target_language="english", distractors="random", interval_scale=1.0,
+             chunk=5000, seed=0, workers=None):
+    """Simulate a learner population; returns (retention per day, accuracy per learner)"""
+    guess_rate = measure_guess_rate(target_language, distractors, seed=seed)
+    difficulty = word_difficulty()
+    seeds = np.random.SeedSequence(seed).spawn((learners + chunk - 1) // chunk)
+
+    jobs = [
+        (min(chunk, learners - start), days, session_length, sessions_per_day,
+         guess_rate, interval_scale, difficulty, chunk_seed)
+        for start, chunk_seed in zip(range(0, learners, chunk), seeds)
+    ]
+    if workers == 1 or len(jobs) == 1:
+        results = [simulate_chunk(*job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+            results = list(pool.map(simulate_chunk, *zip(*jobs)))
+
+    retention = sum(r for r, _, _ in results) / sum(n for _, n, _ in results)
+    return retention, np.concatenate([accuracy for _, _, accuracy in results])
+
+
+def print_report(retention, accuracy):
+    """Print the retention curve and the accuracy distribution"""
+    print("\nRetention (mean recall probability of words seen so far)")
+    step = max(1, len(retention) // 15)
+    for day in sorted(set(range(0, len(retention), step)) | {len(retention) - 1}):
+        bar = "█" * int(retention[day] * 40)
+        print(f"  day {day + 1:>4}  {retention[day]:6.1%}  {bar}")
+
+    print("\nAccuracy per learner")
+    counts, edges = np.histogram(accuracy, bins=10, range=(0.0, 1.0))
+    for count, low, high in zip(counts, edges[:-1], edges[1:]):
+        bar = "█" * int(40 * count / max(counts.max(), 1))
+        print(f"  {low:4.0%}-{high:4.0%}  {count:>8}  {bar}")
+    p10, p50, p90 = np.percentile(accuracy, [10, 50, 90])
+    print(f"\n  mean {accuracy.mean():.1%}   p10 {p10:.1%}   median {p50:.1%}   p90 {p90:.1%}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate learners to tune quiz parameters")
+    parser.add_argument("--learners", type=int, default=100_000)
+    parser.add_argument("--days", type=int, default=90)
+    parser.add_argument("--session-length", type=int, default=10)
+    parser.add_argument("--sessions-per-day", type=int, default=1)
+    parser.add_argument("--language", default="english",
+                        choices=[name for name, _ in LANGUAGES.values()])
+    parser.add_argument("--distractors", default="random",
+                        choices=[name for name, _ in DISTRACTOR_MODES.values()])
+    parser.add_argument("--interval-scale", type=float, default=1.0,
+                        help="multiply every scheduled interval by this factor")
+    parser.add_argument("--chunk", type=int, default=5000, help="learners simulated at once")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None, help="processes (default: all cores)")
+    parser.add_argument("--csv", help="also write day,retention to this file")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    retention, accuracy = simulate(args.learners, args.days, args.session_length,
+                                   args.sessions_per_day, args.language, args.distractors,
+                                   args.interval_scale, args.chunk, args.seed, args.workers)
+    elapsed = time.perf_counter() - start
+
+    print(f"Simulated {args.learners} learners x {args.days} days "
+          f"({args.session_length} questions x {args.sessions_per_day} sessions/day) "
+          f"in {elapsed:.1f}s")
+    print_report(retention, accuracy)
+
+    if args.csv:
+        with open(args.csv, "w") as f:
+            f.write("day,retention\n")
+            for day, value in enumerate(retention, 1):
+                f.write(f"{day},{value:.6f}\n")
+
+
+if __name__ == "__main__":
+    main()
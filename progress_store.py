@@ -0,0 +1,202 @@
+"""
+Progress Store - SQLite
+Review history and per-card scheduling state for every app and language,
+kept in a local SQLite database between sessions.
+
+The database runs in WAL mode. All writes go through a queue to a single
+writer thread, which commits once per finished session (or every
+BATCH_SIZE writes), so recording an answer never blocks the question loop.
+"""
+
+import os
+import queue
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+
+from spaced_repetition import CardState
+
+DATA_HOME = Path(os.environ.get("XDG_DATA_HOME", Path.home() / ".local" / "share"))
+DEFAULT_DB = Path(os.environ.get("LANGUAGE_PROGRESS_DB",
+                                 DATA_HOME / "language-learning" / "progress.sqlite3"))
+
+BATCH_SIZE = 500
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS card_state (
+    app TEXT NOT NULL,
+    language TEXT NOT NULL,
+    card_id TEXT NOT NULL,
+    ease REAL NOT NULL,
+    interval REAL NOT NULL,
+    repetitions INTEGER NOT NULL,
+    lapses INTEGER NOT NULL,
+    due REAL NOT NULL,
+    last_review REAL,
+    PRIMARY KEY (app, language, card_id)
+);
+CREATE INDEX IF NOT EXISTS card_state_due ON card_state (app, language, due);
+
+CREATE TABLE IF NOT EXISTS review (
+    id INTEGER PRIMARY KEY,
+    session_id TEXT NOT NULL,
+    app TEXT NOT NULL,
+    language TEXT NOT NULL,
+    card_id TEXT NOT NULL,
+    reviewed_at REAL NOT NULL,
+    is_correct INTEGER NOT NULL,
+    quality INTEGER,
+    latency_ms REAL
+);
+CREATE INDEX IF NOT EXISTS review_card ON review (app, language, card_id, reviewed_at);
+CREATE INDEX IF NOT EXISTS review_session ON review (session_id);
+
+CREATE TABLE IF NOT EXISTS session (
+    id TEXT PRIMARY KEY,
+    app TEXT NOT NULL,
+    language TEXT NOT NULL,
+    started_at REAL NOT NULL,
+    finished_at REAL,
+    score INTEGER,
+    total INTEGER
+);
+CREATE INDEX IF NOT EXISTS session_started ON session (app, language, started_at);
+"""
+
+UPSERT_STATE = """
+INSERT INTO card_state (app, language, card_id, ease, interval, repetitions, lapses, due, last_review)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (app, language, card_id) DO UPDATE SET
+    ease = excluded.ease, interval = excluded.interval, repetitions = excluded.repetitions,
+    lapses = excluded.lapses, due = excluded.due, last_review = excluded.last_review
+"""
+
+INSERT_REVIEW = """
+INSERT INTO review (session_id, app, language, card_id, reviewed_at, is_correct, quality, latency_ms)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Markers telling the writer thread to commit its current batch or to stop
+_COMMIT = object()
+_STOP = object()
+
+
+def connect(path):
+    """Open a connection with the pragmas every connection should use"""
+    conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+class ProgressStore:
+    """Local progress database with a background writer"""
+
+    def __init__(self, path=DEFAULT_DB):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._reader = connect(self.path)
+        self._reader.executescript(SCHEMA)
+        self._queue = queue.Queue()
+        self._error = None
+        self._writer = threading.Thread(target=self._write_loop, name="progress-writer", daemon=True)
+        self._writer.start()
+
+    def _write_loop(self):
+        conn = connect(self.path)
+        pending = 0
+        try:
+            while True:
+                item = self._queue.get()
+                if item is _STOP:
+                    break
+                if item is _COMMIT:
+                    if pending:
+                        conn.commit()
+                        pending = 0
+                    continue
+                sql, params = item
+                conn.execute(sql, params)
+                pending += 1
+                if pending >= BATCH_SIZE:
+                    conn.commit()
+                    pending = 0
+            conn.commit()
+        except sqlite3.Error as e:
+            self._error = e
+        finally:
+            conn.close()
+
+    def _write(self, sql, params):
+        self._queue.put((sql, params))
+
+    # Reads (caller's thread)
+
+    def load_states(self, app, language, key=str):
+        """Return the saved CardState of every card, with IDs passed through key
+        (a card whose key is None is skipped)"""
+        rows = self._reader.execute(
+            "SELECT card_id, ease, interval, repetitions, lapses, due, last_review "
+            "FROM card_state WHERE app = ? AND language = ?", (app, language))
+        states = (CardState(key(card_id), *rest) for card_id, *rest in rows)
+        return [state for state in states if state.card_id is not None]
+
+    def due_cards(self, app, language, now=None, limit=100):
+        """Return IDs of cards due at now, most overdue first"""
+        now = time.time() if now is None else now
+        rows = self._reader.execute(
+            "SELECT card_id FROM card_state WHERE app = ? AND language = ? AND due <= ? "
+            "ORDER BY due LIMIT ?", (app, language, now, limit))
+        return [card_id for (card_id,) in rows]
+
+    def history(self, app, language, card_id):
+        """Return (reviewed_at, is_correct) for every review of one card"""
+        rows = self._reader.execute(
+            "SELECT reviewed_at, is_correct FROM review "
+            "WHERE app = ? AND language = ? AND card_id = ? ORDER BY reviewed_at",
+            (app, language, str(card_id)))
+        return [(reviewed_at, bool(is_correct)) for reviewed_at, is_correct in rows]
+
+    # Writes (queued for the writer thread)
+
+    def start_session(self, app, language, now=None):
+        """Register a new session and return its ID"""
+        session_id = uuid.uuid4().hex
+        now = time.time() if now is None else now
+        self._write("INSERT INTO session (id, app, language, started_at) VALUES (?, ?, ?, ?)",
+                    (session_id, app, language, now))
+        return session_id
+
+    def record_review(self, session_id, app, language, state, is_correct,
+                      quality=None, latency_ms=None, card_id=None):
+        """Queue one review and the card's new scheduling state, saved under
+        card_id (by default the state's own card ID)"""
+        card_id = str(state.card_id if card_id is None else card_id)
+        self._write(INSERT_REVIEW, (session_id, app, language, card_id, state.last_review,
+                                    int(is_correct), quality, latency_ms))
+        self._write(UPSERT_STATE, (app, language, card_id, state.ease, state.interval,
+                                   state.repetitions, state.lapses, state.due, state.last_review))
+
+    def end_session(self, session_id, score, total, now=None):
+        """Record the final score and commit the session's batch"""
+        now = time.time() if now is None else now
+        self._write("UPDATE session SET finished_at = ?, score = ?, total = ? WHERE id = ?",
+                    (now, score, total, session_id))
+        self._queue.put(_COMMIT)
+
+    def close(self):
+        """Flush every queued write and close the database"""
+        if self._writer.is_alive():
+            self._queue.put(_STOP)
+            self._writer.join()
+        self._reader.close()
+        if self._error is not None:
+            raise self._error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,197 @@
+"""
+Spaced Repetition - SM-2 Scheduler
+Shared by the Japanese flashcards and the Thai alphabet quiz. Card IDs can be
+any hashable value (word indexes, Thai letters, ...).
+
+Reviewed cards sit in a heap keyed on due time, so picking the next card is
+O(log n) however large the deck. Cards never seen before wait in a separate
+queue and are introduced once no review is due.
+"""
+
+import heapq
+import random
+import time
+from collections import deque
+from itertools import islice
+
+DAY = 24 * 60 * 60
+LEARNING_STEP = 10 * 60
+MIN_EASE = 1.3
+START_EASE = 2.5
+
+# Quality grades (SM-2 scale 0-5) for multiple-choice answers
+QUALITY_CORRECT = 4
+QUALITY_WRONG = 1
+
+
+class CardState:
+    """Scheduling state of one card"""
+
+    __slots__ = ("card_id", "ease", "interval", "repetitions", "lapses", "due", "last_review")
+
+    def __init__(self, card_id, ease=START_EASE, interval=0.0, repetitions=0,
+                 lapses=0, due=0.0, last_review=None):
+        self.card_id = card_id
+        self.ease = ease
+        self.interval = interval
+        self.repetitions = repetitions
+        self.lapses = lapses
+        self.due = due
+        self.last_review = last_review
+
+    def __repr__(self):
+        return (f"CardState({self.card_id!r}, ease={self.ease:.2f}, "
+                f"interval={self.interval / DAY:.1f}d, due={self.due:.0f})")
+
+
+def _choose(condition, if_true, if_false):
+    return if_true if condition else if_false
+
+
+def sm2_schedule(ease, interval, repetitions, lapses, quality, choose=_choose):
+    """SM-2 arithmetic for one review; returns (ease, interval, repetitions, lapses).
+
+    Works on plain numbers, or elementwise on arrays when choose is np.where,
+    so batch simulations share the exact rules used by Scheduler.
+    """
+    passed = quality >= 3
+    repetitions = choose(passed, repetitions + 1, 0)
+    lapses = choose(passed, lapses, lapses + 1)
+    interval = choose(passed,
+                      choose(repetitions == 1, DAY,
+                             choose(repetitions == 2, 6 * DAY, interval * ease)),
+                      LEARNING_STEP)
+    ease = ease + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02)
+    ease = choose(ease < MIN_EASE, MIN_EASE, ease)
+    return ease, interval, repetitions, lapses
+
+
+def sm2_update(state, quality, now):
+    """Apply one SM-2 review of the given quality (0-5) to state"""
+    state.ease, state.interval, state.repetitions, state.lapses = sm2_schedule(
+        state.ease, state.interval, state.repetitions, state.lapses, quality)
+    state.due = now + state.interval
+    state.last_review = now
+    return state
+
+
+def next_cards_batch(due, new_order, new_next, n, now):
+    """Array form of Scheduler.next_cards for many learners at once.
+
+    due is a (learners, cards) array holding each card's due time, or +inf
+    for cards not seen yet; new_order holds each learner's order for unseen
+    cards and new_next how many of them have been handed out (updated in
+    place). Returns the (learners, n) card indexes each learner is shown:
+    due reviews (earliest first), then new cards, then the reviews coming
+    due soonest. Requires numpy.
+
+    tests/test_spaced_repetition.py checks the picks against next_cards.
+    """
+    import numpy as np
+
+    cards = due.shape[1]
+    n = min(n, cards)
+    slot = np.arange(n)[None, :]
+
+    picked = np.argpartition(due, n - 1, axis=1)[:, :n]
+    picked_due = np.take_along_axis(due, picked, axis=1)
+    order = np.argsort(picked_due, axis=1)
+    picked = np.take_along_axis(picked, order, axis=1)
+    picked_due = np.take_along_axis(picked_due, order, axis=1)
+
+    n_due = (picked_due <= now).sum(axis=1)[:, None]
+    n_new = np.minimum(n - n_due, cards - new_next[:, None])
+    new_cards = np.take_along_axis(
+        new_order, np.clip(new_next[:, None] + slot - n_due, 0, cards - 1), axis=1)
+    ahead = np.take_along_axis(picked, np.clip(slot - n_new, 0, n - 1), axis=1)
+
+    new_next += n_new[:, 0]
+    return np.where(slot < n_due, picked,
+                    np.where(slot < n_due + n_new, new_cards, ahead))
+
+
+class Scheduler:
+    """Due-time priority queue over one learner's deck"""
+
+    def __init__(self, card_ids, states=(), seed=None):
+        card_ids = list(card_ids)
+        known = set(card_ids)
+        self.states = {}
+        self._heap = []
+        self._counter = 0
+        for state in states:
+            # Saved state for cards no longer in the deck is ignored
+            if state.card_id in known:
+                self.states[state.card_id] = state
+                self._push(state)
+        unseen = [card_id for card_id in card_ids if card_id not in self.states]
+        random.Random(seed).shuffle(unseen)
+        self.new_cards = deque(unseen)
+
+    def __len__(self):
+        return len(self.states) + len(self.new_cards)
+
+    def _push(self, state):
+        # Entries are never removed in place; an entry is stale once the card
+        # has been rescheduled, and is skipped when it reaches the top
+        self._counter += 1
+        heapq.heappush(self._heap, (state.due, self._counter, state.card_id))
+
+    def _peek_valid(self):
+        while self._heap:
+            due, _, card_id = self._heap[0]
+            if self.states[card_id].due == due:
+                return self._heap[0]
+            heapq.heappop(self._heap)
+        return None
+
+    def next_cards(self, n, now=None, include_new=True):
+        """Return up to n card IDs: due reviews first, then new cards,
+        then the reviews coming due soonest"""
+        now = time.time() if now is None else now
+        popped = []
+        result = []
+
+        while len(result) < n:
+            top = self._peek_valid()
+            if top is None or top[0] > now:
+                break
+            popped.append(heapq.heappop(self._heap))
+            result.append(top[2])
+
+        if include_new:
+            result.extend(islice(self.new_cards, n - len(result)))
+
+        while len(result) < n:
+            top = self._peek_valid()
+            if top is None:
+                break
+            popped.append(heapq.heappop(self._heap))
+            result.append(top[2])
+
+        # Selection does not consume cards: put the popped entries back
+        for entry in popped:
+            heapq.heappush(self._heap, entry)
+        return result
+
+    def review(self, card_id, is_correct, now=None, quality=None):
+        """Record an answer for card_id and reschedule it"""
+        now = time.time() if now is None else now
+        if quality is None:
+            quality = QUALITY_CORRECT if is_correct else QUALITY_WRONG
+        state = self.states.get(card_id)
+        if state is None:
+            state = self.states[card_id] = CardState(card_id)
+            # New cards are handed out from the front, so this scan is short
+            try:
+                self.new_cards.remove(card_id)
+            except ValueError:
+                pass
+        sm2_update(state, quality, now)
+        self._push(state)
+        return state
+
+    def due_count(self, now=None):
+        """Number of reviewed cards that are due at now"""
+        now = time.time() if now is None else now
+        return sum(1 for state in self.states.values() if state.due <= now)
@@ -0,0 +1,122 @@
+"""
+Terminal Input - single keypresses
+Shared by the Japanese flashcards and the Thai alphabet quiz.
+
+On a terminal, answers are read one keypress at a time (no Enter needed) and
+timed with time.perf_counter_ns. When stdin is not a terminal (piped input,
+scripted runs) everything falls back to line-buffered input().
+"""
+
+import os
+import sys
+import time
+
+try:
+    import termios
+    import tty
+    import select
+except ImportError:  # Windows
+    termios = None
+    import msvcrt
+
+
+def is_interactive():
+    """True when single-keypress input is available"""
+    try:
+        return sys.stdin.isatty()
+    except (AttributeError, ValueError):
+        return False
+
+
+def _read_key_posix(timeout):
+    fd = sys.stdin.fileno()
+    saved = termios.tcgetattr(fd)
+    try:
+        # cbreak rather than raw: Ctrl-C still raises KeyboardInterrupt
+        tty.setcbreak(fd)
+        ready, _, _ = select.select([fd], [], [], timeout)
+        if not ready:
+            return None
+        # Read everything pending so multi-byte characters and escape
+        # sequences (arrow keys, ...) arrive as one key
+        data = os.read(fd, 32)
+        return data.decode("utf-8", errors="replace")[:1] or None
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, saved)
+
+
+def _read_key_windows(timeout):
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while not msvcrt.kbhit():
+        if deadline is not None and time.monotonic() >= deadline:
+            return None
+        time.sleep(0.01)
+    key = msvcrt.getwch()
+    if key == "\x03":
+        raise KeyboardInterrupt
+    return key
+
+
+def read_key(timeout=None):
+    """Wait for one keypress and return it, or None after timeout seconds"""
+    if termios is None:
+        return _read_key_windows(timeout)
+    return _read_key_posix(timeout)
+
+
+def flush_input():
+    """Drop keys typed ahead (e.g. during feedback) so they cannot answer"""
+    if termios is not None:
+        termios.tcflush(sys.stdin.fileno(), termios.TCIFLUSH)
+    else:
+        while msvcrt.kbhit():
+            msvcrt.getwch()
+
+
+def read_choice(prompt, keys, invalid_message, start_ns=None, flush=True):
+    """Prompt for one of keys and return (key, latency in ns).
+
+    Latency is measured from start_ns (default: when the prompt is shown).
+    Interactively, the first valid keypress answers and other keys are
+    ignored; otherwise a line is read and invalid_message shown until valid.
+    """
+    keys = keys.lower()
+    if not is_interactive():
+        if start_ns is None:
+            start_ns = time.perf_counter_ns()
+        while True:
+            answer = input(prompt).strip().lower()
+            if len(answer) == 1 and answer in keys:
+                return answer, time.perf_counter_ns() - start_ns
+            print(invalid_message)
+
+    if flush:
+        flush_input()
+    print(prompt, end="", flush=True)
+    if start_ns is None:
+        start_ns = time.perf_counter_ns()
+    while True:
+        key = read_key()
+        if key is not None and key.lower() in keys:
+            latency_ns = time.perf_counter_ns() - start_ns
+            print(key)
+            return key.lower(), latency_ns
+
+
+def pause(seconds):
+    """Wait up to seconds; on a terminal any keypress ends the wait early"""
+    if not is_interactive():
+        time.sleep(seconds)
+        return
+    read_key(timeout=seconds)
+
+
+def wait_for_key(prompt, line_prompt=None):
+    """Show prompt and wait for any key (Enter when input is not a terminal)"""
+    if not is_interactive():
+        input(line_prompt or prompt)
+        return
+    flush_input()
+    print(prompt, end="", flush=True)
+    read_key()
+    print()
@@ -0,0 +1,70 @@
+"""
+Terminal Rendering - ANSI frames
+Shared by the Japanese flashcards and the Thai alphabet quiz.
+
+A screen is a list of lines. Screen.render() compares it with the frame
+already on the terminal, rewrites only the lines that changed, erases
+whatever was printed below the old frame (prompts, feedback) and sends it
+all in a single write, with no subprocess and no full-screen flash.
+"""
+
+import os
+import shutil
+import sys
+
+ESC = "\033["
+HOME = ESC + "H"
+CLEAR = ESC + "2J"
+CLEAR_LINE_END = ESC + "K"
+CLEAR_BELOW = ESC + "J"
+HIDE_CURSOR = ESC + "?25l"
+SHOW_CURSOR = ESC + "?25h"
+
+
+def move_to(row, column=1):
+    """Escape sequence placing the cursor at a 1-based row and column"""
+    return f"{ESC}{row};{column}H"
+
+
+class Screen:
+    """Diffing renderer for full-screen frames"""
+
+    def __init__(self, out=None, reserve=8):
+        self.out = out or sys.stdout
+        # Rows kept free below a frame for prompts and feedback; taller frames
+        # would scroll the terminal, so they are always redrawn in full
+        self.reserve = reserve
+        self.frame = None
+        if os.name == "nt":
+            # Turns on escape-sequence processing in the Windows console
+            os.system("")
+
+    def _write(self, parts):
+        self.out.write(HIDE_CURSOR + "".join(parts) + SHOW_CURSOR)
+        self.out.flush()
+
+    def clear(self):
+        """Blank the terminal and forget the current frame"""
+        self._write([HOME, CLEAR])
+        self.frame = []
+
+    def render(self, lines):
+        """Draw a frame, rewriting only the lines that differ from the last one"""
+        lines = [str(line) for line in lines]
+        parts = []
+        rows = shutil.get_terminal_size().lines
+        if self.frame is None or len(lines) + self.reserve > rows:
+            parts += [HOME, CLEAR]
+            changed = range(len(lines))
+        else:
+            changed = [
+                i for i, line in enumerate(lines)
+                if i >= len(self.frame) or self.frame[i] != line
+            ]
+        for i in changed:
+            parts.append(move_to(i + 1) + lines[i] + CLEAR_LINE_END)
+
+        # Erase the rest of the old frame and anything printed under it
+        parts.append(move_to(len(lines) + 1) + CLEAR_BELOW)
+        self._write(parts)
+        self.frame = lines
@@ -0,0 +1,211 @@
+"""
+Tests - audio cache
+AudioCache and AudioPrefetcher driven by the offline stub TTS backend.
+
+    python3 -m pytest tests
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from audio_cache import (STALE_TMP_SECONDS, SUFFIX, AudioCache, AudioPrefetcher,
+                         cache_key)
+from tts_backends import StubBackend
+
+# Texts of one length, so every clip the stub makes has the same size
+A, B, C = "กา", "ขา", "คา"
+
+
+def wait_until(condition, timeout=5.0):
+    """Poll condition until it is true or timeout seconds pass"""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("timed out waiting for the prefetch thread")
+        time.sleep(0.01)
+
+
+class AudioCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.directory = Path(self.tmp.name)
+        self.backend = StubBackend()
+        self.clip_size = len(self.backend(A, "th", False))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def cache(self, clips=10, synthesize=None):
+        """Cache in the test directory with room for the given number of clips"""
+        return AudioCache(synthesize or self.backend, self.directory, clips * self.clip_size)
+
+    def clip_files(self):
+        return sorted(p.name for p in self.directory.iterdir())
+
+    def test_miss_then_hit(self):
+        cache = self.cache()
+        path = cache.get(A)
+        self.assertEqual(cache.get(A), path)
+        self.assertEqual((cache.misses, cache.hits), (1, 1))
+        self.assertEqual(self.backend.calls, 2)  # one here, one in setUp
+        self.assertEqual(path.read_bytes(), self.backend(A, "th", False))
+        self.assertIn((A, "th", False), cache)
+        self.assertNotIn((A, "th", True), cache)
+
+    def test_evicts_least_recently_played(self):
+        cache = self.cache(clips=2)
+        cache.get(A)
+        cache.get(B)
+        cache.get(A)  # A is now more recent than B
+        cache.get(C)
+        self.assertEqual(len(cache), 2)
+        self.assertNotIn((B, "th", False), cache)
+        self.assertFalse(cache.path_for(cache_key(B, "th", False)).exists())
+        self.assertEqual(cache.size, 2 * self.clip_size)
+
+    def test_order_survives_restart(self):
+        cache = self.cache()
+        for age, text in enumerate((A, B, C)):
+            path = cache.get(text)
+            # Oldest use first: A three hours ago, then B, then C
+            stamp = time.time() - (3 - age) * 3600
+            os.utime(path, (stamp, stamp))
+        restarted = self.cache(clips=2)
+        self.assertEqual(len(restarted), 2)
+        self.assertNotIn((A, "th", False), restarted)
+        self.assertIn((C, "th", False), restarted)
+
+    def test_failed_synthesis_leaves_nothing(self):
+        def broken(text, lang, slow):
+            raise RuntimeError("engine down")
+
+        cache = self.cache(synthesize=broken)
+        with self.assertRaises(RuntimeError):
+            cache.get(A)
+        self.assertEqual(self.clip_files(), [])
+        # The clip is not left marked as pending: the next call tries again
+        cache.synthesize = self.backend
+        self.assertTrue(cache.get(A).exists())
+
+    def test_failed_replace_keeps_the_old_clip(self):
+        cache = self.cache()
+        path = cache.get(A)
+        before = path.read_bytes()
+        with mock.patch("audio_cache.os.replace", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                cache.put(cache_key(A, "th", False), b"half a clip")
+        self.assertEqual(path.read_bytes(), before)
+        self.assertEqual(self.clip_files(), [path.name])
+
+    def test_stale_temporary_files_are_removed(self):
+        old = self.directory / "old.tmp"
+        recent = self.directory / "recent.tmp"
+        old.write_bytes(b"x")
+        recent.write_bytes(b"x")
+        stamp = time.time() - STALE_TMP_SECONDS - 60
+        os.utime(old, (stamp, stamp))
+        self.cache()
+        self.assertFalse(old.exists())
+        self.assertTrue(recent.exists())
+
+    def test_adopts_clips_written_by_another_process(self):
+        cache = self.cache()
+        self.assertEqual(len(cache), 0)
+        subprocess.run([sys.executable, "-c", (
+            "import sys; from audio_cache import AudioCache; from tts_backends import StubBackend; "
+            "AudioCache(StubBackend(), sys.argv[1]).get(sys.argv[2])"),
+            str(self.directory), A], cwd=ROOT, check=True)
+        calls = self.backend.calls
+        cache.get(A)
+        self.assertEqual(self.backend.calls, calls)
+        self.assertEqual((cache.hits, cache.misses, len(cache)), (1, 0, 1))
+
+    def test_notices_clips_evicted_by_another_process(self):
+        cache = self.cache()
+        path = cache.get(A)
+        other = self.cache()
+        other.clear()
+        self.assertFalse(path.exists())
+        cache.get(A)
+        self.assertTrue(path.exists())
+        self.assertEqual((cache.misses, cache.size), (2, self.clip_size))
+
+    def test_clip_files_are_content_addressed(self):
+        cache = self.cache()
+        cache.get(A)
+        cache.get(A, slow=True)
+        self.assertEqual(self.clip_files(), sorted(
+            cache_key(A, "th", slow) + SUFFIX for slow in (False, True)))
+
+
+class AudioPrefetcherTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.backend = StubBackend()
+        self.cache = AudioCache(self.backend, self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_counters(self):
+        self.cache.get(A)
+        prefetcher = AudioPrefetcher(self.cache)
+        for text in (A, B, C):
+            self.assertTrue(prefetcher.submit(text))
+        wait_until(lambda: prefetcher.prefetched + prefetcher.already_cached == 3)
+        for text in (A, B, C):
+            self.cache.get(text)
+        prefetcher.close()
+        self.assertEqual(prefetcher.stats(), {
+            "hits": 3, "misses": 1, "prefetched": 2, "already_cached": 1,
+            "dropped": 0, "cancelled": 0, "errors": 0,
+        })
+
+    def test_full_queue_drops_and_cancel_discards(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow(text, lang, slow):
+            started.set()
+            release.wait(5)
+            return self.backend(text, lang, slow)
+
+        self.cache.synthesize = slow
+        prefetcher = AudioPrefetcher(self.cache, maxsize=1)
+        prefetcher.submit(A)
+        started.wait(5)  # A is being synthesized, so the queue is empty again
+        self.assertTrue(prefetcher.submit(B))
+        self.assertFalse(prefetcher.submit(C))
+        prefetcher.cancel()
+        release.set()
+        prefetcher.close()
+        self.assertEqual((prefetcher.prefetched, prefetcher.dropped, prefetcher.cancelled),
+                         (1, 1, 1))
+        self.assertNotIn((B, "th", False), self.cache)
+
+    def test_errors_are_counted_not_raised(self):
+        def broken(text, lang, slow):
+            raise RuntimeError("engine down")
+
+        self.cache.synthesize = broken
+        prefetcher = AudioPrefetcher(self.cache)
+        prefetcher.submit(A)
+        wait_until(lambda: prefetcher.errors == 1)
+        prefetcher.close()
+        self.assertEqual(prefetcher.prefetched, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+"""
+Tests - Japanese answer grading
+Answers are graded on the word IDs behind them, so a translation shared by
+several words is right for each of them, and no question ever offers two
+choices that are both right.
+
+    python3 -m pytest tests
+"""
+
+import functools
+import random
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import japanese_flashcards as jf
+
+LANGUAGES = [language for language, _ in jf.LANGUAGES.values()]
+
+
+@functools.lru_cache(maxsize=None)
+def group(key_field, value_field):
+    """{key: set of values} over the whole deck, by a plain scan"""
+    groups = {}
+    for word in jf.VOCABULARY:
+        groups.setdefault(word[key_field], set()).add(word[value_field])
+    return groups
+
+
+def right_answers(session, word_id):
+    """Every answer that is right for a question, worked out from the deck
+    itself rather than from the indexes the quiz uses"""
+    word = jf.VOCABULARY[word_id]
+    if isinstance(session, (jf.ReverseSession, jf.KanjiFamilySession)):
+        # The translation is the prompt: the kanji of any word with it
+        return group(session.target_language, "kanji")[word[session.target_language]]
+    # The kanji is the prompt: the answer of any entry with that kanji
+    return group("kanji", session.target_language)[word["kanji"]]
+
+
+class SharedTranslationTest(unittest.TestCase):
+
+    def test_shared_translation_is_right_for_every_word(self):
+        for language in LANGUAGES:
+            index = jf.distractor_index(language)
+            shared = [value for value in index.values if len(index.ids_for(value)) > 1]
+            self.assertTrue(shared, f"no shared {language} translations to test")
+            for value in shared:
+                for word_id in index.ids_for(value):
+                    self.assertTrue(jf.is_correct_choice(word_id, value, language))
+
+    def test_another_words_translation_is_wrong(self):
+        rng = random.Random(0)
+        index = jf.distractor_index("english")
+        for word_id in rng.sample(range(len(jf.VOCABULARY)), 200):
+            answer = jf.VOCABULARY.field(word_id, "english")
+            (other,) = index.draw({answer}, 1, rng)
+            self.assertFalse(jf.is_correct_choice(word_id, other, "english"))
+
+
+class OneRightChoiceTest(unittest.TestCase):
+    """Every question of every quiz offers four distinct choices, exactly one
+    of which is right, and the quiz grades each choice accordingly"""
+
+    def check(self, session):
+        while (question := session.next_question()) is not None:
+            self.assertEqual(len(set(question.choices)), 4, question)
+            right = right_answers(session, question.word_id)
+            self.assertEqual([c for c in question.choices if c in right],
+                             [question.correct_answer], question)
+            for choice in question.choices:
+                self.assertEqual(session.grade(question.word_id, choice), choice in right,
+                                 (question, choice))
+            answer = session.submit_answer(question.choices.index(question.correct_answer))
+            self.assertTrue(answer.is_correct)
+        self.assertEqual(session.score, session.total)
+
+    def whole_deck(self, session_class, language, distractors):
+        return session_class(language, distractors=distractors, rng=random.Random(1),
+                             word_ids=range(len(jf.VOCABULARY)))
+
+    def test_translation_quiz(self):
+        for language in LANGUAGES:
+            for distractors in ("random", "confusable"):
+                with self.subTest(language=language, distractors=distractors):
+                    self.check(self.whole_deck(jf.QuizSession, language, distractors))
+
+    def test_reverse_quiz(self):
+        for distractors in ("random", "confusable"):
+            with self.subTest(distractors=distractors):
+                self.check(self.whole_deck(jf.ReverseSession, "english", distractors))
+
+    def test_reading_quiz(self):
+        self.check(self.whole_deck(jf.ReadingSession, "kana", "random"))
+
+    def test_kanji_family_quiz(self):
+        for seed in range(50):
+            self.check(jf.KanjiFamilySession("english", 10, random.Random(seed)))
+
+
+if __name__ == "__main__":
+    unittest.main()
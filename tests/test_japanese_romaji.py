@@ -0,0 +1,105 @@
+"""
+Tests - romaji and kana
+Typed readings are normalized to hiragana and graded against the deck, and
+the deck's romaji is generated back from its kana.
+
+    python3 -m pytest tests
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from japanese_romaji import (fold_long_vowels, katakana_to_hiragana, reading_distance,
+                             to_kana, to_romaji, typo_limit)
+from japanese_vocab_store import load_parts
+
+
+class ToKanaTest(unittest.TestCase):
+
+    def test_spellings(self):
+        cases = {
+            "aimai": "あいまい",
+            "chuushou": "ちゅうしょう",
+            "tyuusyou": "ちゅうしょう",      # Kunrei-shiki
+            "Chūshō": "ちゅうしょう",        # macrons, any case
+            "kattou": "かっとう",             # doubled consonant
+            "matcha": "まっちゃ",             # tch
+            "shin'ai": "しんあい",
+            "konnichiha": "こんにちは",       # nn before a vowel
+            "shimbun": "しんぶん",            # m before b
+            "sampo": "さんぽ",
+            "hon": "ほん",                    # n at the end
+            "fuji": "ふじ",
+            "hu ji": "ふじ",                  # spaces ignored
+            "ウイルス": "ういるす",           # katakana
+            "しゅっちょう": "しゅっちょう",   # kana passes through
+        }
+        for typed, kana in cases.items():
+            with self.subTest(typed=typed):
+                self.assertEqual(to_kana(typed), kana)
+
+    def test_long_vowels_fold_together(self):
+        spellings = {fold_long_vowels(to_kana(text))
+                     for text in ("chuushou", "chūshō", "chuushoo", "ちゅうしょう")}
+        self.assertEqual(len(spellings), 1)
+        self.assertEqual(fold_long_vowels(katakana_to_hiragana("グローバル")),
+                         fold_long_vowels("ぐろおばる"))
+
+
+class ReadingDistanceTest(unittest.TestCase):
+
+    def test_exact_answers(self):
+        self.assertEqual(reading_distance("chuushou", ["ちゅうしょう"]), 0)
+        self.assertEqual(reading_distance("kanyou", ["かんよう"]), 0)   # n' typed as n
+        self.assertEqual(reading_distance("kinen", ["きねん"]), 0)
+        self.assertIsNone(reading_distance("x", ["ちゅうしょう", "あいまい"]))
+        self.assertEqual(reading_distance("aimai", ["ちゅうしょう", "あいまい"]), 0)
+
+    def test_typos(self):
+        # Short readings must be exact; longer ones forgive one slip per four kana
+        self.assertEqual(typo_limit("あいまい"), 0)
+        self.assertIsNone(reading_distance("aimei", ["あいまい"]))
+        self.assertIsNone(reading_distance("sesshuu", ["せっしゅ"]))
+        self.assertEqual(reading_distance("chuushuu", ["ちゅうしょう"]), 1)
+        self.assertIsNone(reading_distance("mujin", ["むじゅん"]))
+
+    def test_every_stored_reading_grades(self):
+        for entry in load_parts():
+            with self.subTest(kana=entry["kana"]):
+                self.assertEqual(reading_distance(to_romaji(entry["kana"]), [entry["kana"]]), 0)
+
+
+class ToRomajiTest(unittest.TestCase):
+
+    def test_spellings(self):
+        cases = {
+            "あいまい": "aimai",
+            "ちゅうしょう": "chuushou",
+            "かっとう": "kattou",
+            "まっちゃ": "matcha",
+            "しんあい": "shin'ai",
+            "かんよう": "kan'you",
+            "しんぶん": "shinbun",
+            "こんにちは": "konnichiha",
+            "じっけん": "jikken",
+            "グローバル": "guroobaru",
+            "ファン": "fan",
+            "ほっ": "ho",
+        }
+        for kana, romaji in cases.items():
+            with self.subTest(kana=kana):
+                self.assertEqual(to_romaji(kana), romaji)
+
+    def test_round_trip(self):
+        for entry in load_parts():
+            kana = entry["kana"]
+            with self.subTest(kana=kana):
+                self.assertEqual(fold_long_vowels(to_kana(to_romaji(kana))),
+                                 fold_long_vowels(katakana_to_hiragana(kana)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+"""
+Tests - spaced repetition
+The array forms used by learner_simulation must pick and reschedule cards
+exactly like Scheduler does for one learner.
+
+    python3 -m pytest tests
+"""
+
+import random
+import sys
+import unittest
+from collections import deque
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from spaced_repetition import (DAY, CardState, Scheduler, next_cards_batch,
+                               sm2_schedule)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+CARDS = 40
+NOW = 100 * DAY
+
+
+def learner_scheduler(due, order, seen):
+    """Scheduler holding one learner's state: the first seen cards of order
+    reviewed (due at the given times), the rest still new, in order"""
+    states = [CardState(card, due=float(due[card])) for card in order[:seen]]
+    scheduler = Scheduler(range(len(due)), states)
+    scheduler.new_cards = deque(order[seen:])
+    return scheduler
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class NextCardsBatchTest(unittest.TestCase):
+
+    def random_learners(self, learners, seed):
+        rng = np.random.default_rng(seed)
+        order = np.argsort(rng.random((learners, CARDS)), axis=1)
+        seen = rng.integers(0, CARDS + 1, learners)
+        due = np.full((learners, CARDS), np.inf)
+        for row in range(learners):
+            # Distinct due times on both sides of NOW, so there are no ties
+            times = NOW + rng.permutation(CARDS)[:seen[row]] * 3600.0 - 20 * 3600.0
+            due[row, order[row, :seen[row]]] = times
+        return due, order, seen
+
+    def test_matches_scheduler(self):
+        for n in (1, 5, 10, CARDS):
+            due, order, seen = self.random_learners(200, seed=n)
+            new_next = seen.copy()
+            picks = next_cards_batch(due, order, new_next, n, NOW)
+            for row in range(len(due)):
+                scheduler = learner_scheduler(due[row], list(order[row]), seen[row])
+                expected = scheduler.next_cards(n, NOW)
+                self.assertEqual(list(picks[row]), expected, f"learner {row}, n={n}")
+                handed_out = sum(1 for card in expected if card not in scheduler.states)
+                self.assertEqual(new_next[row], seen[row] + handed_out)
+
+    def test_sm2_schedule_matches_elementwise(self):
+        rng = random.Random(0)
+        rows = [(rng.uniform(1.3, 3.0), rng.choice([0.0, DAY, 6 * DAY, 20 * DAY]),
+                 rng.randrange(4), rng.randrange(3), rng.choice([1, 4]))
+                for _ in range(200)]
+        arrays = [np.array(column, dtype=np.float64) for column in zip(*rows)]
+        batch = sm2_schedule(*arrays, choose=np.where)
+        for i, row in enumerate(rows):
+            for got, want in zip(batch, sm2_schedule(*row)):
+                self.assertAlmostEqual(float(got[i]), want)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,194 @@
+"""
+TTS Backends - speech synthesis engines
+Every engine the apps can speak through, behind one interface: a backend is
+called as backend(text, lang, slow) and returns the encoded clip (MP3, WAV).
+Each backend times its own calls, so deployments can pick the fastest engine
+(see benchmarks/bench_tts_backends.py).
+
+    gtts    Google TTS; needs the network (pip install gTTS)
+    espeak  espeak-ng (or espeak) run locally; fully offline
+    clips   pre-recorded files in a directory: <dir>/<lang>/<text>.wav|.mp3|.ogg
+    stub    deterministic tones, for tests and machines with no engine at all
+
+The backend used by the apps is chosen with LANGUAGE_TTS (default gtts);
+the clips backend reads LANGUAGE_TTS_CLIPS.
+"""
+
+import hashlib
+import io
+import math
+import os
+import shutil
+import struct
+import subprocess
+import time
+import wave
+from collections import deque
+from pathlib import Path
+
+DEFAULT_BACKEND = os.environ.get("LANGUAGE_TTS", "gtts")
+
+# Latency samples kept per backend for the percentiles
+LATENCY_SAMPLES = 1000
+
+
+class TTSBackend:
+    """Base class: subclasses implement _synthesize(text, lang, slow)"""
+
+    name = None
+
+    def __init__(self):
+        self.calls = 0
+        self.failures = 0
+        self.total_ns = 0
+        self.latencies_ns = deque(maxlen=LATENCY_SAMPLES)
+
+    def available(self):
+        """True if the engine can run on this machine"""
+        return True
+
+    def _synthesize(self, text, lang, slow):
+        raise NotImplementedError
+
+    def __call__(self, text, lang, slow):
+        """Synthesize one clip and record how long it took"""
+        start = time.perf_counter_ns()
+        try:
+            data = self._synthesize(text, lang, slow)
+        except Exception:
+            self.failures += 1
+            raise
+        elapsed = time.perf_counter_ns() - start
+        self.calls += 1
+        self.total_ns += elapsed
+        self.latencies_ns.append(elapsed)
+        return data
+
+    def stats(self):
+        """Call count and latency summary in milliseconds"""
+        samples = sorted(self.latencies_ns)
+
+        def percentile(p):
+            return samples[min(len(samples) - 1, int(p * len(samples)))] / 1e6 if samples else 0.0
+
+        return {
+            "backend": self.name, "calls": self.calls, "failures": self.failures,
+            "mean_ms": self.total_ns / self.calls / 1e6 if self.calls else 0.0,
+            "p50_ms": percentile(0.5), "p95_ms": percentile(0.95),
+            "max_ms": samples[-1] / 1e6 if samples else 0.0,
+        }
+
+
+class GTTSBackend(TTSBackend):
+    """Google TTS over the network; returns MP3"""
+
+    name = "gtts"
+
+    def available(self):
+        try:
+            import gtts  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    def _synthesize(self, text, lang, slow):
+        from gtts import gTTS
+
+        buffer = io.BytesIO()
+        gTTS(text=text, lang=lang, slow=slow).write_to_fp(buffer)
+        return buffer.getvalue()
+
+
+class EspeakBackend(TTSBackend):
+    """espeak-ng (or classic espeak) as a local subprocess; returns WAV"""
+
+    name = "espeak"
+
+    def __init__(self, executable=None, speed=160):
+        super().__init__()
+        self.executable = executable or shutil.which("espeak-ng") or shutil.which("espeak")
+        self.speed = speed
+
+    def available(self):
+        return self.executable is not None
+
+    def _synthesize(self, text, lang, slow):
+        if self.executable is None:
+            raise RuntimeError("espeak-ng is not installed")
+        speed = self.speed // 2 if slow else self.speed
+        result = subprocess.run(
+            [self.executable, "--stdout", "-v", lang, "-s", str(speed), text],
+            capture_output=True, check=True)
+        return result.stdout
+
+
+class ClipDirectoryBackend(TTSBackend):
+    """Pre-recorded clips: <directory>/<lang>/<text>.wav (or .mp3, .ogg).
+
+    A slow clip is looked up as <text>.slow.<ext> first and falls back to
+    the normal recording.
+    """
+
+    name = "clips"
+    EXTENSIONS = (".wav", ".mp3", ".ogg")
+
+    def __init__(self, directory=None):
+        super().__init__()
+        self.directory = Path(directory or os.environ.get("LANGUAGE_TTS_CLIPS", "clips"))
+
+    def available(self):
+        return self.directory.is_dir()
+
+    def _synthesize(self, text, lang, slow):
+        stems = [f"{text}.slow", text] if slow else [text]
+        for stem in stems:
+            for extension in self.EXTENSIONS:
+                path = self.directory / lang / (stem + extension)
+                if path.is_file():
+                    return path.read_bytes()
+        raise FileNotFoundError(f"No recording of {text!r} in {self.directory / lang}")
+
+
+class StubBackend(TTSBackend):
+    """Deterministic offline stand-in for a TTS engine; returns WAV.
+
+    Each (text, lang, slow) gets its own short tone, so clips differ the
+    way real ones do without touching the network.
+    """
+
+    name = "stub"
+
+    def __init__(self, rate=8000):
+        super().__init__()
+        self.rate = rate
+
+    def _synthesize(self, text, lang, slow):
+        digest = hashlib.sha256(f"{lang}\0{int(bool(slow))}\0{text}".encode("utf-8")).digest()
+        frequency = 220 + digest[0] * 2
+        seconds = min(0.1 * max(len(text), 1), 1.0) * (2 if slow else 1)
+        samples = int(self.rate * seconds)
+        frames = struct.pack(f"<{samples}h", *(
+            int(8000 * math.sin(2 * math.pi * frequency * i / self.rate)) for i in range(samples)))
+
+        buffer = io.BytesIO()
+        with wave.open(buffer, "wb") as out:
+            out.setnchannels(1)
+            out.setsampwidth(2)
+            out.setframerate(self.rate)
+            out.writeframes(frames)
+        return buffer.getvalue()
+
+
+BACKENDS = {
+    backend.name: backend
+    for backend in (GTTSBackend, EspeakBackend, ClipDirectoryBackend, StubBackend)
+}
+
+
+def get_backend(name=None, **options):
+    """Create the backend called name (default: LANGUAGE_TTS, else gtts)"""
+    name = name or DEFAULT_BACKEND
+    try:
+        return BACKENDS[name](**options)
+    except KeyError:
+        raise ValueError(f"Unknown TTS backend {name!r}; choose from {', '.join(BACKENDS)}") from None